@@ -1,19 +1,22 @@
 """Core module for configuration and logging."""
 
 from .config import ConfigManager
-from .logging_config import setup_logging
+from .logging_config import setup_logging, shutdown_logging
 from .constants import (
     CONFIG_FILE,
     LOG_FILE,
     DEFAULT_CONFIG,
+    AUTO_COMPUTE_TYPES,
     VALID_AUDIO_VIDEO_EXTENSIONS
 )
 
 __all__ = [
     'ConfigManager',
     'setup_logging',
+    'shutdown_logging',
     'CONFIG_FILE',
     'LOG_FILE',
     'DEFAULT_CONFIG',
+    'AUTO_COMPUTE_TYPES',
     'VALID_AUDIO_VIDEO_EXTENSIONS'
 ]
\ No newline at end of file
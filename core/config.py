@@ -2,28 +2,77 @@
 
 import json
 import os
+import threading
 from typing import Dict, Any
 from .constants import CONFIG_FILE, DEFAULT_CONFIG
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class ConfigManager:
+    SAVE_DELAY_SECONDS = 0.5
+    
     def __init__(self):
         self.config = DEFAULT_CONFIG.copy()
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+        # Bytes last written to CONFIG_FILE, so identical saves can be skipped
+        self._last_saved = None
         self.load()
     
     def load(self) -> None:
         """Load configuration from file."""
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, "r") as f:
-                    loaded = json.load(f)
-                    self.config.update(loaded)
+                with open(CONFIG_FILE, "rb") as f:
+                    content = f.read()
+                loaded = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
+                self.config.update(loaded)
             except Exception as e:
                 print(f"[Config] Failed to load config: {e}")
     
     def save(self) -> None:
-        """Save configuration to file."""
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(self.config, f)
+        """Save configuration to file, replacing it atomically."""
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self.config)
+            else:
+                data = json.dumps(self.config).encode("utf-8")
+            
+            if data == self._last_saved:
+                # Same bytes as on disk; skip the rewrite and fsync
+                return
+            
+            temp_path = CONFIG_FILE + ".tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, CONFIG_FILE)
+            self._last_saved = data
+    
+    def schedule_save(self, delay: float = None) -> None:
+        """Save after a short delay, coalescing bursts of changes into one write."""
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(
+                self.SAVE_DELAY_SECONDS if delay is None else delay, self.save
+            )
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Write out a pending scheduled save immediately."""
+        if self._save_timer:
+            self.save()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
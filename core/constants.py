@@ -1,16 +1,58 @@
 """Application constants and configuration defaults."""
 
+import os
+
 CONFIG_FILE = "config.json"
 LOG_FILE = "logs.txt"
 
 DEFAULT_CONFIG = {
     "history_path": None,
     "whisper_model": "base",
-    "whisper_device": "cpu",
+    "whisper_device": "auto",
+    "whisper_compute_type": "auto",
+    "whisper_batch_size": 16,
+    "whisper_beam_size": 1,
+    # "auto" batches on CUDA only; true/false forces it on or off
+    "whisper_batched_inference": "auto",
+    "whisper_backend": "faster_whisper",
+    "whisper_quant": "q5_1",
+    "whisper_cpp_binary": "whisper-cli",
+    "max_concurrent_transcriptions": 2,
     "wait_timer_minutes": 60,
+    # Longest gap between history checks when watchdog is unavailable
+    "poll_interval_seconds": 5,
+}
+
+# CTranslate2 compute type used when whisper_compute_type is "auto"
+AUTO_COMPUTE_TYPES = {
+    "cuda": "int8_float16",
+    "cpu": "int8",
 }
 
-VALID_AUDIO_VIDEO_EXTENSIONS = [
+# Quantized GGML weights for the whisper.cpp backend
+WHISPER_CPP_MODEL_URL = "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/{filename}"
+WHISPER_CPP_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "whisper-ggml")
+
+# Weights published for each model in that repo; "f16" is the unquantized file.
+# The .en variants have the same quants as their multilingual model.
+_SMALL_MODEL_QUANTS = ("f16", "q5_1", "q8_0")
+_LARGE_MODEL_QUANTS = ("f16", "q5_0", "q8_0")
+WHISPER_CPP_QUANTS = {
+    "tiny": _SMALL_MODEL_QUANTS,
+    "base": _SMALL_MODEL_QUANTS,
+    "small": _SMALL_MODEL_QUANTS,
+    "medium": _LARGE_MODEL_QUANTS,
+    "large-v1": ("f16",),
+    "large-v2": _LARGE_MODEL_QUANTS,
+    "large-v3": ("f16", "q5_0"),
+    "large-v3-turbo": _LARGE_MODEL_QUANTS,
+}
+
+# Last calendar webhook response, shown at startup while a fresh fetch runs
+EVENTS_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "rooche", "events.json")
+
+# Tuple so it can be passed straight to str.endswith
+VALID_AUDIO_VIDEO_EXTENSIONS = (
     '.mp3', '.mp4', '.wav', '.m4a', '.flac', 
     '.ogg', '.webm', '.avi', '.mov', '.wmv'
-]
\ No newline at end of file
+)
\ No newline at end of file
@@ -1,20 +1,49 @@
 """Logging configuration for the application."""
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_listener = None
+
+def setup_logging(filename="logs.txt", level=logging.INFO):
+    """Set up logging configuration.
+
+    Records are handed to a queue and written to the log file and console
+    by a background listener, so logging calls never block on disk or stdout.
+    """
+    global _listener
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
 
-def setup_logging(filename="logs.txt"):
-    """Set up logging configuration."""
     # File handler
-    logging.basicConfig(
-        filename=filename,
-        filemode="a",
-        level=logging.DEBUG,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-    )
+    file_handler = logging.FileHandler(filename, mode="a")
+    file_handler.setFormatter(formatter)
 
     # Console handler
     console = logging.StreamHandler()
-    console.setLevel(logging.DEBUG)
-    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
     console.setFormatter(formatter)
-    logging.getLogger().addHandler(console)
\ No newline at end of file
+
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console, respect_handler_level=True)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    listener.start()
+    atexit.register(listener.stop)
+    _listener = listener
+    return listener
+
+def shutdown_logging():
+    """Write out queued records and close the handlers.
+
+    Call before os._exit, which skips the atexit hook that stops the listener.
+    """
+    global _listener
+    if _listener is not None:
+        atexit.unregister(_listener.stop)
+        _listener.stop()
+        _listener = None
+    logging.shutdown()
@@ -14,7 +14,7 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl
 from PyQt6.QtGui import QFont, QDesktopServices
 
 from .dialogs import PassFailDialog, WaitForUploadDialog
-from utils.helpers import extract_notion_url
+from utils.helpers import extract_notion_url, format_countdown
 
 class CalendarRefreshThread(QThread):
     """Thread for refreshing calendar events."""
@@ -32,11 +32,24 @@ class CalendarRefreshThread(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
+class WebhookSendThread(QThread):
+    """Thread for sending a pass/fail result without blocking the window."""
+    finished = pyqtSignal(bool)
+    
+    def __init__(self, webhook_service, **data):
+        super().__init__()
+        self.webhook_service = webhook_service
+        self.data = data
+    
+    def run(self):
+        self.finished.emit(self.webhook_service.send_data(**self.data))
+
 class SettingsDialog(QDialog):
     """Dialog for configuration settings."""
-    def __init__(self, parent, config_manager):
+    def __init__(self, parent, config_manager, audio_processor):
         super().__init__(parent)
         self.config_manager = config_manager
+        self.audio_processor = audio_processor
         self.setWindowTitle("Settings")
         self.setMinimumWidth(200)
         self.ui_elements = {}
@@ -63,12 +76,22 @@ class SettingsDialog(QDialog):
         self.ui_elements['model_entry'].setMaximumWidth(100)
         config_layout.addWidget(self.ui_elements['model_entry'])
         
-        config_layout.addWidget(QLabel("Device:"))
+        config_layout.addWidget(QLabel("Device (auto, cpu, cuda):"))
         self.ui_elements['device_entry'] = QLineEdit()
-        self.ui_elements['device_entry'].setText(self.config_manager.get("whisper_device", "cpu"))
+        self.ui_elements['device_entry'].setText(self.config_manager.get("whisper_device", "auto"))
         self.ui_elements['device_entry'].setMaximumWidth(100)
         config_layout.addWidget(self.ui_elements['device_entry'])
         
+        resolved_label = QLabel(f"Using: {self.audio_processor.resolve_device()}")
+        resolved_label.setStyleSheet("color: gray;")
+        config_layout.addWidget(resolved_label)
+        
+        config_layout.addWidget(QLabel("Compute Type (auto, int8, float16, int8_float16):"))
+        self.ui_elements['compute_type_entry'] = QLineEdit()
+        self.ui_elements['compute_type_entry'].setText(self.config_manager.get("whisper_compute_type", "auto"))
+        self.ui_elements['compute_type_entry'].setMaximumWidth(100)
+        config_layout.addWidget(self.ui_elements['compute_type_entry'])
+        
         config_group.setLayout(config_layout)
         layout.addWidget(config_group)
         
@@ -114,7 +137,7 @@ class SettingsDialog(QDialog):
             self.config_manager.set("history_path", path)
             self.parent().update_file_labels()
             self.parent().update_submit_button_state()
-            self.config_manager.save()
+            self.config_manager.schedule_save()
     
     def select_sharex_exe(self):
         """Select ShareX executable file."""
@@ -128,7 +151,7 @@ class SettingsDialog(QDialog):
             self.config_manager.set("sharex_exe_path", path)
             self.parent().update_file_labels()
             self.parent().update_submit_button_state()
-            self.config_manager.save()
+            self.config_manager.schedule_save()
     
     def accept(self):
         """Save settings when OK is clicked."""
@@ -137,10 +160,25 @@ class SettingsDialog(QDialog):
             if wait_minutes <= 0:
                 QMessageBox.critical(self, "Error", "Time limit must be greater than 0 minutes.")
                 return
+            whisper_model = self.ui_elements['model_entry'].text().strip()
+            whisper_device = self.ui_elements['device_entry'].text().strip() or "auto"
+            compute_type = self.ui_elements['compute_type_entry'].text().strip() or "auto"
+            model_changed = (
+                whisper_model != self.config_manager.get("whisper_model") or
+                whisper_device != self.config_manager.get("whisper_device") or
+                compute_type != self.config_manager.get("whisper_compute_type")
+            )
+            
             self.config_manager.set("wait_timer_minutes", wait_minutes)
-            self.config_manager.set("whisper_model", self.ui_elements['model_entry'].text().strip())
-            self.config_manager.set("whisper_device", self.ui_elements['device_entry'].text().strip())
+            self.config_manager.set("whisper_model", whisper_model)
+            self.config_manager.set("whisper_device", whisper_device)
+            self.config_manager.set("whisper_compute_type", compute_type)
             self.config_manager.save()
+            
+            # Reload the Whisper model in the background if its settings changed
+            if model_changed:
+                self.audio_processor.clear_model_cache()
+                self.audio_processor.preload_model()
             super().accept()
         except ValueError:
             QMessageBox.critical(self, "Error", "Please enter a valid number for time limit.")
@@ -159,9 +197,27 @@ class CalendarTab(QWidget):
         self.ui_elements = {}
         self.event_data = []
         self.current_monitoring_params = None
+        self.refresh_thread = None
+        self.pass_fail_thread = None
         self.create_ui()
         
-        # Auto-load calendar events on startup
+        # Countdown ticks on the GUI thread instead of from the monitoring worker;
+        # ticking at 500 ms keeps it on the second, the label only redraws on change
+        self.last_countdown_text = None
+        self.countdown_timer = QTimer(self)
+        self.countdown_timer.setInterval(500)
+        self.countdown_timer.timeout.connect(self.update_countdown)
+        
+        # Arrow-keying through the list only auto-fills once the selection settles
+        self.select_timer = QTimer(self)
+        self.select_timer.setSingleShot(True)
+        self.select_timer.setInterval(50)
+        self.select_timer.timeout.connect(self.auto_fill_from_selection)
+        
+        # Show the last saved events straight away, then auto-load fresh ones
+        cached_events = self.calendar_service.load_cached_events()
+        if cached_events:
+            self.on_events_loaded(cached_events)
         QTimer.singleShot(1000, self.refresh_calendar_events)
     
     def create_ui(self):
@@ -282,7 +338,7 @@ class CalendarTab(QWidget):
     
     def show_settings_dialog(self):
         """Show the settings dialog."""
-        dialog = SettingsDialog(self, self.config_manager)
+        dialog = SettingsDialog(self, self.config_manager, self.audio_processor)
         dialog.exec()
     
     def create_file_labels(self, parent_layout):
@@ -438,6 +494,10 @@ class CalendarTab(QWidget):
     
     def refresh_calendar_events(self):
         """Refresh the calendar events list."""
+        # Single-flight: the startup timer and the button can overlap
+        if self.refresh_thread is not None and self.refresh_thread.isRunning():
+            return
+        
         self.cal_refresh_button.setText("Refreshing...")
         self.cal_refresh_button.setEnabled(False)
         
@@ -454,6 +514,7 @@ class CalendarTab(QWidget):
         
         if events:
             upcoming_index = -1
+            display_texts = []
             for i, event in enumerate(events):
                 display_text = event['display_text']
                 
@@ -464,7 +525,9 @@ class CalendarTab(QWidget):
                     if upcoming_index == -1:
                         upcoming_index = i
                 
-                self.cal_listbox.addItem(display_text)
+                display_texts.append(display_text)
+            
+            self.cal_listbox.addItems(display_texts)
             
             # Auto-select the most upcoming meeting
             if upcoming_index >= 0:
@@ -485,8 +548,8 @@ class CalendarTab(QWidget):
         self.cal_refresh_button.setEnabled(True)
     
     def on_calendar_select(self):
-        """Handle calendar selection."""
-        self.auto_fill_from_selection()
+        """Handle calendar selection; restarting the timer coalesces rapid changes."""
+        self.select_timer.start()
     
     def auto_fill_from_selection(self):
         """Auto-fill form fields based on selected calendar event."""
@@ -591,6 +654,25 @@ class CalendarTab(QWidget):
             status_update,
             on_monitoring_complete
         )
+        self.last_countdown_text = None
+        self.update_countdown()
+        self.countdown_timer.start()
+    
+    def update_countdown(self):
+        """Show the remaining monitoring time."""
+        if not self.monitoring_service.monitoring_active:
+            self.countdown_timer.stop()
+            return
+        
+        time_str = format_countdown(self.monitoring_service.remaining_seconds())
+        countdown_text = f"👀 Monitoring for uploads... {time_str} remaining"
+        # Keep a persistent history read error visible under the countdown
+        error_text = self.monitoring_service.last_error_text
+        if error_text:
+            countdown_text += f"\n{error_text}"
+        if countdown_text != self.last_countdown_text:
+            self.last_countdown_text = countdown_text
+            self.status_label.setText(countdown_text)
     
     def stop_monitoring(self):
         """Stop monitoring process with user confirmation."""
@@ -604,6 +686,7 @@ class CalendarTab(QWidget):
         elif result == "stop":
             # Stop monitoring completely
             self.monitoring_service.stop_monitoring()
+            self.countdown_timer.stop()
             
             # Stop ShareX recording
             if self.sharex_service.stop_recording():
@@ -616,6 +699,10 @@ class CalendarTab(QWidget):
     
     def handle_pass_fail(self):
         """Handle pass/fail submission."""
+        # Single-flight: a result is still being sent
+        if self.pass_fail_thread is not None and self.pass_fail_thread.isRunning():
+            return
+        
         notion_url = self.ui_elements['notion_entry'].text().strip()
         description = self.ui_elements['description_entry'].text().strip()
         
@@ -639,16 +726,20 @@ class CalendarTab(QWidget):
         if result and reason:
             self.status_label.setText("📤 Sending pass/fail result...")
             
-            success = self.webhook_service.send_data(
+            def on_sent(success):
+                if success:
+                    self.status_label.setText(f"✅ {result.title()} result sent successfully!")
+                else:
+                    self.status_label.setText("❌ Failed to send pass/fail result")
+            
+            self.pass_fail_thread = WebhookSendThread(
+                self.webhook_service,
                 notion_url=notion_url,
                 description=description,
                 result=result,
                 reason=reason
             )
-            
-            if success:
-                self.status_label.setText(f"✅ {result.title()} result sent successfully!")
-            else:
-                self.status_label.setText("❌ Failed to send pass/fail result")
+            self.pass_fail_thread.finished.connect(on_sent)
+            self.pass_fail_thread.start()
         else:
             self.status_label.setText("❌ Pass/fail submission cancelled")
\ No newline at end of file
@@ -11,6 +11,7 @@ from PyQt6.QtGui import QIcon
 from dotenv import load_dotenv
 
 from core.config import ConfigManager
+from core.logging_config import shutdown_logging
 from services.audio_processor import AudioProcessor
 from services.calendar_service import CalendarService
 from services.sharex_service import ShareXService
@@ -29,6 +30,7 @@ class MainApplication(QMainWindow):
         # Initialize services
         self.config_manager = ConfigManager()
         self.audio_processor = AudioProcessor(self.config_manager)
+        self.audio_processor.preload_model()
         self.calendar_service = CalendarService()
         self.sharex_service = ShareXService(self.config_manager)
         self.webhook_service = WebhookService()
@@ -86,6 +88,30 @@ class MainApplication(QMainWindow):
     
     def closeEvent(self, event):
         """Handle application close event."""
+        abort_jobs = False
+        if self.manual_tab.has_active_jobs():
+            reply = QMessageBox.question(
+                self,
+                "Transcription Running",
+                "Files are still being transcribed.\n\n"
+                "Yes: close the window and let them finish and send in the background.\n"
+                "No: quit now and discard them.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
+                QMessageBox.StandardButton.Yes
+            )
+            if reply == QMessageBox.StandardButton.Cancel:
+                event.ignore()
+                return
+            abort_jobs = reply == QMessageBox.StandardButton.No
+        
+        self.config_manager.flush()
+        self.manual_tab.shutdown(cancel_queued=abort_jobs)
+        if abort_jobs:
+            # Worker threads can't be cancelled, and interpreter exit would join them;
+            # os._exit skips atexit, so write out queued log records first
+            shutdown_logging()
+            os._exit(0)
+        
         # Stop monitoring service if running
         if hasattr(self, 'monitoring_service') and self.monitoring_service:
             self.monitoring_service.stop()
@@ -1,34 +1,53 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton,
     QListWidget, QMessageBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 
-class FileProcessingThread(QThread):
-    """Thread for processing selected files."""
+class FileListRefreshThread(QThread):
+    """Thread for reading recent files from the ShareX history."""
+    finished = pyqtSignal(list)
+    
+    def __init__(self, sharex_service):
+        super().__init__()
+        self.sharex_service = sharex_service
+    
+    def run(self):
+        self.finished.emit(self.sharex_service.get_recent_files())
+
+class FileProcessingSignals(QObject):
+    """Signals emitted by a file processing job running on the worker pool."""
     status_update = pyqtSignal(str)
-    processing_complete = pyqtSignal()
+    processing_complete = pyqtSignal(str)
+
+class FileProcessingJob:
+    """Processes one selected file on the transcription pool."""
     
     def __init__(self, audio_processor, webhook_service, file_info, 
                  notion_url, description, local_file_path):
-        super().__init__()
         self.audio_processor = audio_processor
         self.webhook_service = webhook_service
         self.file_info = file_info
         self.notion_url = notion_url
         self.description = description
         self.local_file_path = local_file_path
+        # Signals are queued across threads, so UI updates land on the GUI thread
+        self.signals = FileProcessingSignals()
     
     def run(self):
         try:
-            self.status_update.emit(f"🎬 Processing: {self.file_info['filename']}")
+            self.signals.status_update.emit(f"🎬 Processing: {self.file_info['filename']}")
             
             # Process the file
             transcription = self.audio_processor.process_file(
                 self.local_file_path, 
-                lambda msg: self.status_update.emit(msg)
+                lambda msg: self.signals.status_update.emit(msg),
+                lambda segments: self.webhook_service.send_partial(
+                    self.notion_url, self.description, segments
+                )
             )
             
             if transcription:
@@ -38,16 +57,17 @@ class FileProcessingThread(QThread):
                     self.description, 
                     transcription,
                     self.file_info['url'], 
-                    self.local_file_path
+                    self.local_file_path,
+                    after_partials=True
                 )
-                self.status_update.emit("✅ File processed and sent to webhook!")
+                self.signals.status_update.emit("✅ File processed and sent to webhook!")
             else:
-                self.status_update.emit("❌ File processing failed")
+                self.signals.status_update.emit("❌ File processing failed")
                 
         except Exception as e:
-            self.status_update.emit(f"❌ Error: {str(e)}")
+            self.signals.status_update.emit(f"❌ Error: {str(e)}")
         finally:
-            self.processing_complete.emit()
+            self.signals.processing_complete.emit(self.local_file_path)
 
 class ManualTab(QWidget):
     def __init__(self, parent, config_manager, sharex_service, audio_processor, 
@@ -60,6 +80,11 @@ class ManualTab(QWidget):
         self.calendar_tab = calendar_tab
         
         self.file_data = []
+        # Small bounded pool: ffmpeg/decoding of one file overlaps Whisper on another
+        max_workers = max(1, int(self.config_manager.get("max_concurrent_transcriptions", 2)))
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="transcribe")
+        self.active_jobs = {}
+        self.refresh_thread = None
         self.create_ui()
     
     def create_ui(self):
@@ -145,18 +170,23 @@ class ManualTab(QWidget):
     
     def refresh_file_list(self):
         """Refresh the list of recent audio/video files."""
+        if self.refresh_thread is not None and self.refresh_thread.isRunning():
+            return
+        
         self.manual_refresh_button.setText("Refreshing...")
         self.manual_refresh_button.setEnabled(False)
         
-        # Clear current list
+        # Reading and parsing the history can be slow, so it runs off the GUI thread
+        self.refresh_thread = FileListRefreshThread(self.sharex_service)
+        self.refresh_thread.finished.connect(self.on_files_loaded)
+        self.refresh_thread.start()
+    
+    def on_files_loaded(self, recent_files):
+        """Show the recent files read by the refresh thread."""
         self.manual_listbox.clear()
         
-        # Get recent files
-        recent_files = self.sharex_service.get_recent_files()
-        
         if recent_files:
-            for file_info in recent_files:
-                self.manual_listbox.addItem(file_info['display_text'])
+            self.manual_listbox.addItems([file_info['display_text'] for file_info in recent_files])
             
             # Store file info
             self.file_data = recent_files
@@ -219,16 +249,11 @@ class ManualTab(QWidget):
             QMessageBox.critical(self, "Error", f"File not found: {local_file_path}")
             return
         
-        # Update config with values from config_manager
-        self.config_manager.set("whisper_model", self.config_manager.get("whisper_model", "small"))
-        self.config_manager.set("whisper_device", self.config_manager.get("whisper_device", "cuda"))
-        self.config_manager.save()
-        
-        # Disable button during processing
-        self.process_selected_button.setEnabled(False)
+        if local_file_path in self.active_jobs:
+            QMessageBox.information(self, "Already Processing", f"{file_info['filename']} is already being processed.")
+            return
         
-        # Create and start processing thread
-        self.processing_thread = FileProcessingThread(
+        job = FileProcessingJob(
             self.audio_processor,
             self.webhook_service,
             file_info,
@@ -238,24 +263,31 @@ class ManualTab(QWidget):
         )
         
         # Connect signals
-        self.processing_thread.status_update.connect(self.update_status)
-        self.processing_thread.processing_complete.connect(self.on_processing_complete)
+        job.signals.status_update.connect(self.update_status)
+        job.signals.processing_complete.connect(self.on_processing_complete)
         
-        # Start the thread
-        self.processing_thread.start()
+        # Keep the job (and its signals) alive until it reports completion
+        self.active_jobs[local_file_path] = job
+        self.executor.submit(job.run)
     
     def update_status(self, message):
         """Update the status label in the calendar tab."""
         if hasattr(self.calendar_tab, 'status_label'):
             self.calendar_tab.status_label.setText(message)
     
-    def on_processing_complete(self):
-        """Re-enable the process button when processing is complete."""
-        self.process_selected_button.setEnabled(True)
+    def on_processing_complete(self, local_file_path):
+        """Forget a finished job so the same file can be processed again."""
+        self.active_jobs.pop(local_file_path, None)
+    
+    def has_active_jobs(self) -> bool:
+        """Whether a selected file is still queued or being transcribed."""
+        return bool(self.active_jobs)
+    
+    def shutdown(self, cancel_queued: bool = True):
+        """Stop taking jobs, dropping queued ones unless cancel_queued is False.
         
-        # Clean up the thread
-        if hasattr(self, 'processing_thread'):
-            self.processing_thread.quit()
-            self.processing_thread.wait()
-            self.processing_thread.deleteLater()
-            self.processing_thread = None
\ No newline at end of file
+        A job that is already running can't be interrupted: the process keeps
+        running after the window closes until it finishes, because
+        concurrent.futures joins its workers at interpreter exit.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=cancel_queued)
@@ -6,7 +6,6 @@ from datetime import datetime, timezone
 import tkinter as tk
 from tkinter import messagebox, filedialog
 import requests
-import tempfile
 import subprocess
 import logging
 
@@ -24,6 +23,9 @@ console.setLevel(logging.DEBUG)
 formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
 console.setFormatter(formatter)
 logging.getLogger().addHandler(console)
+# Lowercase suffixes; str.endswith accepts the tuple directly
+VALID_AUDIO_VIDEO_EXTENSIONS = ('.mp3', '.mp4', '.wav', '.m4a', '.flac', '.ogg', '.webm', '.avi', '.mov', '.wmv')
+
 CONFIG_FILE = "config.json"
 config = {
     "history_path": None,
@@ -64,30 +66,31 @@ def validate_gladia_api_key(api_key):
 
 
 def extract_audio(file_path, status_callback):
-    """Extract audio from video/audio file and return path to extracted audio"""
+    """Extract audio from video/audio file as MP3 bytes, kept in memory"""
     status_callback("🎧 Extracting audio from file...")
     logging.debug(f"[Audio] Starting audio extraction from: {file_path}")
     
-    temp_audio_path = tempfile.mktemp(suffix=".mp3")
     try:
-        subprocess.run(
-            ["ffmpeg", "-y", "-i", file_path, "-vn", "-acodec", "libmp3lame", "-q:a", "4", temp_audio_path],
+        # Encode straight to stdout so nothing is written to (or left in) the temp dir
+        result = subprocess.run(
+            ["ffmpeg", "-nostdin", "-loglevel", "error", "-i", file_path, "-vn",
+             "-acodec", "libmp3lame", "-q:a", "4", "-f", "mp3", "pipe:1"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             check=True
         )
         
-        if os.path.exists(temp_audio_path):
-            logging.debug(f"[Audio] Audio extracted successfully to: {temp_audio_path}")
+        if result.stdout:
+            logging.debug(f"[Audio] Audio extracted successfully ({len(result.stdout)} bytes)")
             status_callback("✅ Audio extraction completed!")
-            return temp_audio_path
+            return result.stdout
         else:
-            logging.error("[Audio] Audio file not created")
-            status_callback("❌ Audio extraction failed - no output file")
+            logging.error("[Audio] ffmpeg produced no audio")
+            status_callback("❌ Audio extraction failed - no output")
             return None
             
     except subprocess.CalledProcessError as e:
-        logging.error(f"[Audio] Error extracting audio: {e.stderr.decode()}")
+        logging.error(f"[Audio] Error extracting audio: {e.stderr.decode(errors='replace')}")
         status_callback("❌ Audio extraction failed")
         return None
     except Exception as e:
@@ -96,8 +99,8 @@ def extract_audio(file_path, status_callback):
         return None
 
 
-def transcribe_with_gladia(audio_file_path, status_callback):
-    """Transcribe audio file using Gladia API"""
+def transcribe_with_gladia(audio_data, status_callback):
+    """Transcribe MP3 audio bytes using Gladia API"""
     try:
         api_key = config.get("gladia_api_key", "").strip()
         if not api_key:
@@ -111,16 +114,8 @@ def transcribe_with_gladia(audio_file_path, status_callback):
             return None
 
         status_callback("🎯 Starting Gladia transcription...")
-        logging.debug(f"[Gladia] Starting transcription of: {audio_file_path}")
         logging.debug(f"[Gladia] API key length: {len(api_key)} characters")
-        
-        # Check if file exists and get file size
-        if not os.path.exists(audio_file_path):
-            status_callback("❌ Audio file not found")
-            return None
-            
-        file_size = os.path.getsize(audio_file_path)
-        logging.debug(f"[Gladia] Audio file size: {file_size} bytes")
+        logging.debug(f"[Gladia] Audio size: {len(audio_data)} bytes")
 
         # Step 1: Upload audio to Gladia
         status_callback("📤 Uploading audio to Gladia...")
@@ -129,27 +124,26 @@ def transcribe_with_gladia(audio_file_path, status_callback):
             "x-gladia-key": api_key
         }
 
-        with open(audio_file_path, "rb") as f:
-            files = {"audio": (os.path.basename(audio_file_path), f, "audio/mpeg")}
-            try:
-                upload_response = requests.post(upload_url, headers=headers, files=files, timeout=60)
-                
-                # Log the response details for debugging
-                logging.debug(f"[Gladia] Upload response status: {upload_response.status_code}")
-                logging.debug(f"[Gladia] Upload response headers: {upload_response.headers}")
-                
-                if upload_response.status_code != 200:
-                    error_text = upload_response.text
-                    logging.error(f"[Gladia] Upload failed with status {upload_response.status_code}: {error_text}")
-                    status_callback(f"❌ Upload failed: {error_text}")
-                    return None
-                    
-                upload_response.raise_for_status()
-                
-            except requests.exceptions.RequestException as e:
-                logging.error(f"[Gladia] Upload request failed: {e}")
-                status_callback(f"❌ Upload request failed: {e}")
+        files = {"audio": ("audio.mp3", audio_data, "audio/mpeg")}
+        try:
+            upload_response = requests.post(upload_url, headers=headers, files=files, timeout=60)
+            
+            # Log the response details for debugging
+            logging.debug(f"[Gladia] Upload response status: {upload_response.status_code}")
+            logging.debug(f"[Gladia] Upload response headers: {upload_response.headers}")
+            
+            if upload_response.status_code != 200:
+                error_text = upload_response.text
+                logging.error(f"[Gladia] Upload failed with status {upload_response.status_code}: {error_text}")
+                status_callback(f"❌ Upload failed: {error_text}")
                 return None
+                
+            upload_response.raise_for_status()
+            
+        except requests.exceptions.RequestException as e:
+            logging.error(f"[Gladia] Upload request failed: {e}")
+            status_callback(f"❌ Upload request failed: {e}")
+            return None
 
         try:
             upload_data = upload_response.json()
@@ -279,23 +273,13 @@ def process_audio_file(file_path, status_callback):
     """Process audio/video file: extract audio first, then transcribe"""
     try:
         # Step 1: Extract audio from the file
-        audio_path = extract_audio(file_path, status_callback)
-        if not audio_path or not os.path.exists(audio_path):
+        audio_data = extract_audio(file_path, status_callback)
+        if not audio_data:
             status_callback("❌ Failed to extract audio")
             return None
 
         # Step 2: Transcribe the extracted audio
-        transcription = transcribe_with_gladia(audio_path, status_callback)
-        
-        # Step 3: Clean up temporary audio file
-        try:
-            if os.path.exists(audio_path):
-                os.remove(audio_path)
-                logging.debug(f"[Cleanup] Removed temporary audio file: {audio_path}")
-        except Exception as e:
-            logging.warning(f"[Cleanup] Failed to remove temporary file: {e}")
-
-        return transcription
+        return transcribe_with_gladia(audio_data, status_callback)
         
     except Exception as e:
         logging.error(f"[Process] Error processing audio file: {e}")
@@ -322,8 +306,7 @@ def wait_for_audio_video_upload(after_dt: datetime, callback, status_callback):
                     if entry_time > after_dt:
                         logging.debug(f"[Monitor] New file found: {entry['FileName']}")
                         file_name = entry.get("FileName", "").lower()
-                        valid_ext = ['.mp3', '.mp4', '.wav', '.m4a', '.flac', '.ogg', '.webm', '.avi', '.mov', '.wmv']
-                        if any(file_name.endswith(ext) for ext in valid_ext):
+                        if file_name.endswith(VALID_AUDIO_VIDEO_EXTENSIONS):
                             status_callback("🎬 Found audio/video file!")
                             local_file_path = entry["FilePath"]
                             if os.path.exists(local_file_path):
@@ -1,21 +1,46 @@
 import json
 import time
+import functools
+import hashlib
+import itertools
+import re
+import html
+import sys
 import os
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 import tkinter as tk
 from tkinter import messagebox, filedialog, ttk, simpledialog
 import requests
-import tempfile
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import NewConnectionError
 import subprocess
 import logging
-from transcribe_anything import transcribe_anything
 from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+
+def read_webhook_urls():
+    """Read the webhook endpoints once instead of on every click"""
+    global WEBHOOK_URL, WEBHOOK_EVENTS_URL
+    WEBHOOK_URL = os.getenv("WEBHOOK_URL", "").strip()
+    WEBHOOK_EVENTS_URL = os.getenv("WEBHOOK_URL2", "").strip()
+
+
+def reload_env():
+    """Re-read .env, letting edited values replace the ones loaded at startup"""
+    load_dotenv(override=True)
+    read_webhook_urls()
+
+
+read_webhook_urls()
+
 # Set up logging
 logging.basicConfig(
     filename="logs.txt",
@@ -32,13 +57,42 @@ console.setFormatter(formatter)
 logging.getLogger().addHandler(console)
 
 CONFIG_FILE = "config.json"
+# Last calendar payload, listed at startup while a fresh copy is fetched
+CALENDAR_CACHE_FILE = "calendar_cache.json"
+CALENDAR_CACHE_TTL_SECONDS = 15 * 60
 config = {
     "history_path": None,
     "whisper_model": "base",
-    "whisper_device": "cpu",
+    "whisper_device": "auto",
+    "whisper_compute_type": "auto",
     "wait_timer_minutes": 60,
+    "poll_interval_seconds": 5,
 }
 
+# Shared widget styles
+FONT_8 = ("Arial", 8)
+FONT_9 = ("Arial", 9)
+FONT_10 = ("Arial", 10)
+FONT_11 = ("Arial", 11)
+FONT_BOLD_10 = ("Arial", 10, "bold")
+FONT_BOLD_11 = ("Arial", 11, "bold")
+FONT_BOLD_12 = ("Arial", 12, "bold")
+FONT_BOLD_16 = ("Arial", 16, "bold")
+COLOR_GREEN = "#4CAF50"
+COLOR_RED = "#FF5722"
+COLOR_BLUE = "#2196F3"
+COLOR_ORANGE = "#FF9800"
+
+# Lowercase suffixes; str.endswith accepts the tuple directly
+VALID_AUDIO_VIDEO_EXTENSIONS = ('.mp3', '.mp4', '.wav', '.m4a', '.flac', '.ogg', '.webm', '.avi', '.mov', '.wmv')
+
+# JSON last written to CONFIG_FILE, so identical saves can be skipped
+last_saved_config = None
+
+# Pending Tk after() id for a debounced config save
+save_after_id = None
+SAVE_DELAY_MS = 500
+
 # Global variables for monitoring control
 monitoring_active = False
 monitoring_thread = None
@@ -52,6 +106,142 @@ except ImportError:
     PYNPUT_AVAILABLE = False
     print("Warning: pynput not installed. ShareX keyboard shortcuts will not work.")
     print("Install with: pip install pynput")
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+# Set by the watchdog observer whenever the ShareX history file changes
+history_changed = threading.Event()
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    json_dumps = lambda data: json.dumps(data).encode("utf-8")
+
+try:
+    from ciso8601 import parse_datetime as ciso_parse_datetime
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+HISTORY_DECODER = json.JSONDecoder()
+
+# Polling fallback when watchdog is missing: start fast, back off while idle
+POLL_MIN_SECONDS = 0.25
+POLL_BACKOFF = 1.5
+HISTORY_SEPARATORS = " \t\r\n,\ufeff"
+
+
+class HistoryChangeHandler(FileSystemEventHandler):
+    """Wake the monitoring worker when the ShareX history file is written"""
+    def __init__(self, history_path):
+        super().__init__()
+        self.history_path = os.path.normcase(os.path.abspath(history_path))
+
+    def on_any_event(self, event):
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path and os.path.normcase(os.path.abspath(path)) == self.history_path:
+                history_changed.set()
+                return
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_iso_datetime(value):
+    """Parse an ISO 8601 timestamp as an aware datetime (naive means UTC), memoized per string"""
+    entry_time = None
+    if CISO8601_AVAILABLE:
+        try:
+            entry_time = ciso_parse_datetime(value)
+        except ValueError:
+            # Let fromisoformat have a go at anything ciso8601 rejects
+            pass
+    if entry_time is None:
+        if sys.version_info < (3, 11) and value.endswith("Z"):
+            # fromisoformat only accepts a trailing Z from Python 3.11
+            value = value[:-1] + "+00:00"
+        entry_time = datetime.fromisoformat(value)
+    if entry_time.tzinfo is None:
+        entry_time = entry_time.replace(tzinfo=timezone.utc)
+    return entry_time
+
+
+def parse_history_entries(text):
+    """Decode consecutive history entries; returns (entries, characters consumed).
+
+    An entry ShareX is still writing is left unconsumed for the next read.
+    """
+    # Fast path: a fully written chunk parses in one call
+    body = text.strip(HISTORY_SEPARATORS)
+    if not body:
+        return [], len(text)
+    try:
+        parsed = json_loads("[" + body + "]")
+        return [entry for entry in parsed if isinstance(entry, dict)], len(text)
+    except ValueError:
+        pass
+
+    entries = []
+    pos = 0
+    length = len(text)
+    while True:
+        while pos < length and text[pos] in HISTORY_SEPARATORS:
+            pos += 1
+        if pos >= length:
+            break
+        try:
+            entry, pos_after = HISTORY_DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            break
+        if isinstance(entry, dict):
+            entries.append(entry)
+        pos = pos_after
+    return entries, pos
+
+
+def read_new_history_entries(history_path, offset):
+    """Parse only what was appended after byte offset; returns (entries, new offset)"""
+    # stat before opening: most wake-ups find nothing new, and opening a file
+    # ShareX is writing to is the costlier syscall on Windows
+    size = os.stat(history_path).st_size
+    if size == offset:
+        return [], offset
+    if size < offset:
+        # History was cleared or replaced; start over
+        offset = 0
+    
+    with open(history_path, 'rb') as f:
+        f.seek(offset)
+        text = f.read().decode('utf-8', errors='surrogateescape')
+
+    entries, consumed = parse_history_entries(text)
+    offset += len(text[:consumed].encode('utf-8', errors='surrogateescape'))
+    return entries, offset
+
+
+def start_history_observer(history_path):
+    """Watch the history file's folder; returns None when watchdog is unavailable"""
+    if not WATCHDOG_AVAILABLE:
+        return None
+    try:
+        observer = Observer()
+        observer.schedule(HistoryChangeHandler(history_path),
+                          os.path.dirname(os.path.abspath(history_path)), recursive=False)
+        observer.start()
+        logging.debug("[Monitor] Watching history file for changes")
+        return observer
+    except Exception as e:
+        logging.warning(f"[Monitor] Could not watch history file, polling instead: {e}")
+        return None
+
+
 def trigger_sharex_recording():
     """Trigger ShareX screen recording with Shift + Print Screen"""
     if not PYNPUT_AVAILABLE:
@@ -148,13 +338,13 @@ class PassFailDialog:
         title_label = tk.Label(
             main_frame,
             text="Meeting Result",
-            font=("Arial", 16, "bold"),
+            font=FONT_BOLD_16,
             fg="#333"
         )
         title_label.pack(pady=(0, 20))
         
         # Result selection frame
-        result_frame = tk.LabelFrame(main_frame, text="Select Result", font=("Arial", 11, "bold"))
+        result_frame = tk.LabelFrame(main_frame, text="Select Result", font=FONT_BOLD_11)
         result_frame.pack(fill=tk.X, pady=(0, 15))
         
         self.result_var = tk.StringVar()
@@ -165,7 +355,7 @@ class PassFailDialog:
             text="✅ Pass - Meeting was successful",
             variable=self.result_var,
             value="pass",
-            font=("Arial", 10),
+            font=FONT_10,
             fg="green"
         )
         pass_radio.pack(anchor=tk.W, padx=15, pady=8)
@@ -176,13 +366,13 @@ class PassFailDialog:
             text="❌ Fail - Meeting had issues",
             variable=self.result_var,
             value="fail",
-            font=("Arial", 10),
+            font=FONT_10,
             fg="red"
         )
         fail_radio.pack(anchor=tk.W, padx=15, pady=8)
         
         # Reason frame
-        reason_frame = tk.LabelFrame(main_frame, text="Reason (Required)", font=("Arial", 11, "bold"))
+        reason_frame = tk.LabelFrame(main_frame, text="Reason (Required)", font=FONT_BOLD_11)
         reason_frame.pack(fill=tk.X, pady=(0, 20))
         
         # Reason text area with scrollbar
@@ -194,7 +384,7 @@ class PassFailDialog:
             height=4,
             width=50,
             wrap=tk.WORD,
-            font=("Arial", 10)
+            font=FONT_10
         )
         
         scrollbar = tk.Scrollbar(text_frame)
@@ -227,7 +417,7 @@ class PassFailDialog:
             command=self.cancel,
             bg="#757575",
             fg="white",
-            font=("Arial", 11),
+            font=FONT_11,
             padx=20,
             pady=10,
             width=12
@@ -239,9 +429,9 @@ class PassFailDialog:
             button_container,
             text="✅ Submit Result",
             command=self.submit,
-            bg="#4CAF50",
+            bg=COLOR_GREEN,
             fg="white",
-            font=("Arial", 11, "bold"),
+            font=FONT_BOLD_11,
             padx=20,
             pady=10,
             width=15
@@ -310,94 +500,197 @@ class PassFailDialog:
         return self.result, self.reason
 
 def save_config():
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f)
+    global save_after_id, last_saved_config
+    save_after_id = None
+    data = json.dumps(config)
+    if data == last_saved_config:
+        # Same bytes as on disk; skip the rewrite and fsync
+        return
+    # Write to a temp file and swap it in so a crash never leaves a torn config
+    temp_path = CONFIG_FILE + ".tmp"
+    with open(temp_path, "w") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, CONFIG_FILE)
+    last_saved_config = data
+
+
+def schedule_save_config(widget):
+    """Coalesce a burst of edits into one write SAVE_DELAY_MS after the last one"""
+    global save_after_id
+    if save_after_id is not None:
+        widget.after_cancel(save_after_id)
+    save_after_id = widget.after(SAVE_DELAY_MS, save_config)
+
+
+def update_config(widget, **values):
+    """Apply settings and schedule a save, skipping the write when nothing changed"""
+    changed = {key: value for key, value in values.items() if config.get(key) != value}
+    if changed:
+        config.update(changed)
+        schedule_save_config(widget)
+    return bool(changed)
 
 
 def load_config():
+    global last_saved_config
     if os.path.exists(CONFIG_FILE):
         try:
             with open(CONFIG_FILE, "r") as f:
                 loaded = json.load(f)
                 config.update(loaded)
+            # Only counts as saved if the file already holds exactly this config
+            if loaded == config:
+                last_saved_config = json.dumps(config)
         except Exception as e:
             print(f"[Config] Failed to load config: {e}")
 
 
+def create_http_session():
+    """Pooled session so calendar fetches and webhook posts reuse keep-alive connections"""
+    retry = Retry(
+        total=3,
+        # Connection failures are retried for any method. Read errors never are,
+        # and the default allowed_methods leaves POST out of status retries, since
+        # a 502/504 from a proxy can arrive after n8n already ran the workflow
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504]
+    )
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+http_session = create_http_session()
+# (connect, read) timeouts in seconds
+WEBHOOK_TIMEOUT = (5, 30)
+# Short connect timeout so a dead calendar host fails fast, like CalendarService.TIMEOUT
+CALENDAR_TIMEOUT = (3.05, 10)
+
+
+# Calendar events that started longer ago than this are not listed
+PAST_EVENT_HORIZON_SECONDS = 24 * 60 * 60
+
+
 def fetch_calendar_events():
-    """Fetch calendar events from the webhook"""
+    """Fetch calendar events from the webhook; returns (events, etag)"""
     try:
-        webhook_url = os.getenv("WEBHOOK_URL2", "").strip()
+        webhook_url = WEBHOOK_EVENTS_URL
         if not webhook_url: 
             logging.error("[Calendar] No webhook events URL configured")
-            return []
+            return [], None
         
         logging.debug(f"[Calendar] Fetching events from: {webhook_url}")
-        response = requests.get(webhook_url, timeout=10)
+        response = http_session.get(webhook_url, timeout=CALENDAR_TIMEOUT)
         response.raise_for_status()
         
         events = response.json()
         if not isinstance(events, list):
             logging.error("[Calendar] Response is not a list")
-            return []
-        
-        # Process and sort events
-        processed_events = []
-        now = datetime.now(timezone.utc)
-        
-        for event in events:
-            try:
-                # Parse start time
-                start_time_str = event['start']['dateTime']
-                start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                
-                # Convert to local time for display
-                local_start = start_time.astimezone()
-                
-                # Extract participant name from summary (assumes format like "Initial: 25min with Jing (Geraldo Tolentino)")
-                summary = event.get('summary', '')
-                participant_name = extract_participant_name(summary)
-                
-                # Create display time
-                display_time = local_start.strftime("%I:%M %p")  # e.g., "1:30 PM"
-                
-                # Determine if this is an upcoming meeting (within next 30 minutes)
-                time_diff = start_time - now
-                is_upcoming = 0 <= time_diff.total_seconds() <= 1800  # 30 minutes = 1800 seconds
-                
-                processed_event = {
-                    'id': event['id'],
-                    'summary': summary,
-                    'start_datetime': start_time,
-                    'local_start': local_start,
-                    'display_time': display_time,
-                    'participant_name': participant_name,
-                    'notion_url': event.get('description', '').strip(),
-                    'location': event.get('location', ''),
-                    'is_upcoming': is_upcoming,
-                    'time_until': time_diff.total_seconds() if time_diff.total_seconds() > 0 else 0,
-                    'display_text': f"{local_start.strftime('%Y-%m-%d %I:%M %p')} - {summary}",
-                    'auto_description': f"{display_time} {participant_name}".strip()
-                }
-                
-                processed_events.append(processed_event)
-                
-            except Exception as e:
-                logging.warning(f"[Calendar] Error processing event: {e}")
-                continue
-        
-        # Sort events by start time
-        processed_events.sort(key=lambda x: x['start_datetime'])
+            return [], None
         
-        logging.debug(f"[Calendar] Successfully processed {len(processed_events)} events")
-        return processed_events
+        # Fingerprint of the raw body, to tell whether the cached listing changed
+        etag = hashlib.sha256(response.content).hexdigest()
+        save_calendar_cache(events, etag)
+        return process_calendar_events(events), etag
         
     except requests.RequestException as e:
         logging.error(f"[Calendar] Network error fetching events: {e}")
-        return []
+        return [], None
     except Exception as e:
         logging.error(f"[Calendar] Error fetching calendar events: {e}")
-        return []
+        return [], None
+
+
+def process_calendar_events(events):
+    """Turn raw webhook events into sorted display entries"""
+    processed_events = []
+    now = datetime.now(timezone.utc)
+    
+    for event in events:
+        try:
+            # Parse start time
+            start_time_str = event['start']['dateTime']
+            start_time = parse_iso_datetime(start_time_str)
+            
+            # Skip events that are long over before doing any formatting
+            seconds_until = (start_time - now).total_seconds()
+            if seconds_until < -PAST_EVENT_HORIZON_SECONDS:
+                continue
+            
+            # Convert to local time for display
+            local_start = start_time.astimezone()
+            
+            # Extract participant name from summary (assumes format like "Initial: 25min with Jing (Geraldo Tolentino)")
+            summary = event.get('summary', '')
+            participant_name = extract_participant_name(summary)
+            
+            # Create display time
+            display_time = local_start.strftime("%I:%M %p")  # e.g., "1:30 PM"
+            
+            # Determine if this is an upcoming meeting (within next 30 minutes)
+            is_upcoming = 0 <= seconds_until <= 1800  # 30 minutes = 1800 seconds
+            
+            processed_event = {
+                'id': event['id'],
+                'summary': summary,
+                'start_datetime': start_time,
+                'local_start': local_start,
+                'display_time': display_time,
+                'participant_name': participant_name,
+                'notion_url': event.get('description', '').strip(),
+                'location': event.get('location', ''),
+                'is_upcoming': is_upcoming,
+                'time_until': seconds_until if seconds_until > 0 else 0,
+                'display_text': f"{local_start.strftime('%Y-%m-%d %I:%M %p')} - {summary}",
+                'auto_description': f"{display_time} {participant_name}".strip()
+            }
+            
+            processed_events.append(processed_event)
+            
+        except Exception as e:
+            logging.warning(f"[Calendar] Error processing event: {e}")
+            continue
+    
+    # Sort events by start time
+    processed_events.sort(key=lambda x: x['start_datetime'])
+    
+    logging.debug(f"[Calendar] Successfully processed {len(processed_events)} events")
+    return processed_events
+
+
+def save_calendar_cache(events, etag):
+    """Keep the raw payload on disk so the next start can list it immediately"""
+    try:
+        temp_path = CALENDAR_CACHE_FILE + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"etag": etag, "ts": time.time(), "events": events}, f)
+        os.replace(temp_path, CALENDAR_CACHE_FILE)
+    except Exception as e:
+        logging.warning(f"[Calendar] Could not save events cache: {e}")
+
+
+def load_calendar_cache():
+    """Return (events, etag) from a fresh cache file, or None"""
+    try:
+        with open(CALENDAR_CACHE_FILE, "r") as f:
+            cached = json.load(f)
+        if time.time() - cached["ts"] > CALENDAR_CACHE_TTL_SECONDS:
+            return None
+        return process_calendar_events(cached["events"]), cached["etag"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"[Calendar] Ignoring unreadable events cache: {e}")
+        return None
+
+
+# Capitalized summary words that are never part of a participant name
+NAME_STOPWORDS = frozenset({'Initial', 'Interview', 'Meeting', 'With'})
 
 
 def extract_participant_name(summary):
@@ -423,14 +716,14 @@ def extract_participant_name(summary):
         
         # If no specific pattern found, try to extract from summary
         # Look for capitalized words that might be names
-        words = summary.split()
-        potential_names = []
-        for word in words:
-            if word.istitle() and len(word) > 2 and word not in ['Initial', 'Interview', 'Meeting', 'With']:
-                potential_names.append(word)
+        potential_names = list(itertools.islice(
+            (word for word in summary.split()
+             if word.istitle() and len(word) > 2 and word not in NAME_STOPWORDS),
+            2  # Take first two capitalized words; stop scanning once found
+        ))
         
         if potential_names:
-            return " ".join(potential_names[:2])  # Take first two capitalized words
+            return " ".join(potential_names)
             
         return "Meeting"  # Default fallback
         
@@ -439,52 +732,132 @@ def extract_participant_name(summary):
         return "Meeting"
 
 
-def refresh_calendar_events(listbox, refresh_button, ui_elements):
-    """Refresh the calendar events list"""
+# Held while a calendar refresh is in flight
+calendar_refresh_lock = threading.Lock()
+# Periodic revalidation so upcoming-meeting highlights stay current
+CALENDAR_AUTO_REFRESH_MS = 60_000
+calendar_auto_refresh_id = None
+
+
+def schedule_calendar_auto_refresh(listbox, refresh_button, ui_elements):
+    """(Re)arm the periodic calendar refresh, replacing any pending one"""
+    global calendar_auto_refresh_id
+    if calendar_auto_refresh_id is not None:
+        listbox.after_cancel(calendar_auto_refresh_id)
+    calendar_auto_refresh_id = listbox.after(
+        CALENDAR_AUTO_REFRESH_MS, auto_refresh_calendar_events, listbox, refresh_button, ui_elements
+    )
+
+
+def auto_refresh_calendar_events(listbox, refresh_button, ui_elements):
+    """Timer callback: refresh quietly unless an upload is being monitored"""
+    global calendar_auto_refresh_id
+    calendar_auto_refresh_id = None
+    if monitoring_active:
+        schedule_calendar_auto_refresh(listbox, refresh_button, ui_elements)
+        return
+    refresh_calendar_events(listbox, refresh_button, ui_elements, background=True)
+
+
+def refresh_calendar_events(listbox, refresh_button, ui_elements, use_cache=False, background=False):
+    """Refresh the calendar events list; use_cache lists a fresh saved payload while fetching.
+
+    Background refreshes keep the user's selection and never overwrite a filled-in form.
+    """
+    # Single-flight: the timers and the button can overlap; released in show_events
+    if not calendar_refresh_lock.acquire(blocking=False):
+        logging.debug("[Calendar] Refresh already in progress, skipping")
+        return
+    
+    # Any refresh, manual or timed, restarts the auto-refresh countdown
+    schedule_calendar_auto_refresh(listbox, refresh_button, ui_elements)
+    
     refresh_button.config(text="Refreshing...", state=tk.DISABLED)
     
-    def refresh_worker():
-        try:
-            # Clear current list
-            listbox.delete(0, tk.END)
-            
-            # Fetch events
-            events = fetch_calendar_events()
-            
-            if events:
-                for event in events:
-                    display_text = event['display_text']
-                    
-                    # Highlight upcoming meetings
-                    if event['is_upcoming']:
-                        minutes_until = int(event['time_until'] / 60)
-                        display_text += f" [STARTING IN {minutes_until} MIN!]"
-                    
-                    listbox.insert(tk.END, display_text)
-                
-                # Store event data
-                listbox.event_data = events
+    cached = load_calendar_cache() if use_cache else None
+    
+    def show_events(events, error=None, etag=None):
+        """Fill the listbox with fetched events; runs on the Tk thread"""
+        # Safe to release first: another refresh can only start on this thread
+        calendar_refresh_lock.release()
+        if cached is not None and error is None and etag in (None, cached[1]):
+            # Same payload as the cached listing (or the fetch failed and logged why);
+            # keep the listing, selection and form as they are
+            logging.debug("[Calendar] Keeping cached events")
+            refresh_button.config(text="Refresh Events", state=tk.NORMAL)
+            return
+        if background and (error is not None or etag is None):
+            # A failed timed refresh (already logged) leaves the current list alone
+            refresh_button.config(text="Refresh Events", state=tk.NORMAL)
+            return
+        fill_listbox(events, error)
+    
+    def fill_listbox(events, error=None):
+        selected_id = None
+        if background:
+            selection = listbox.curselection()
+            if selection and selection[0] < len(listbox.event_data):
+                selected_id = listbox.event_data[selection[0]]['id']
+        
+        listbox.delete(0, tk.END)
+        
+        if error is not None:
+            listbox.insert(tk.END, f"Error loading events: {error}")
+            listbox.event_data = []
+        elif events:
+            display_texts = []
+            for event in events:
+                display_text = event['display_text']
                 
-                # Auto-select the most upcoming meeting if within 30 minutes
-                upcoming_events = [i for i, event in enumerate(events) if event['is_upcoming']]
-                if upcoming_events:
-                    # Select the first upcoming event
-                    listbox.selection_set(upcoming_events[0])
-                    listbox.see(upcoming_events[0])  # Scroll to show the selection
-                    # Auto-fill the form
-                    auto_fill_from_selection(listbox, ui_elements)
+                # Highlight upcoming meetings
+                if event['is_upcoming']:
+                    minutes_until = int(event['time_until'] / 60)
+                    display_text += f" [STARTING IN {minutes_until} MIN!]"
                 
-            else:
-                listbox.insert(tk.END, "No calendar events found")
-                listbox.event_data = []
+                display_texts.append(display_text)
+            
+            # One insert call instead of a Tcl round-trip per event
+            listbox.insert(tk.END, *display_texts)
+            
+            # Store event data
+            listbox.event_data = events
             
+            # Auto-select the most upcoming meeting if within 30 minutes
+            upcoming_events = [i for i, event in enumerate(events) if event['is_upcoming']]
+            if selected_id is not None:
+                # Background refresh: put the user's selection back
+                for i, event in enumerate(events):
+                    if event['id'] == selected_id:
+                        listbox.selection_set(i)
+                        break
+            elif upcoming_events and not (background and form_has_text()):
+                # Select the first upcoming event
+                listbox.selection_set(upcoming_events[0])
+                listbox.see(upcoming_events[0])  # Scroll to show the selection
+                # Auto-fill the form
+                auto_fill_from_selection(listbox, ui_elements)
+            
+        else:
+            listbox.insert(tk.END, "No calendar events found")
+            listbox.event_data = []
+        
+        refresh_button.config(text="Refresh Events", state=tk.NORMAL)
+    
+    def form_has_text():
+        return bool(ui_elements['notion_entry'].get().strip() or ui_elements['description_entry'].get().strip())
+    
+    def refresh_worker():
+        # Only the network fetch runs here; Tk widgets are updated via after()
+        try:
+            events, etag = fetch_calendar_events()
+            listbox.after(0, show_events, events, None, etag)
         except Exception as e:
             logging.error(f"[Calendar] Error refreshing events: {e}")
-            listbox.delete(0, tk.END)
-            listbox.insert(tk.END, f"Error loading events: {str(e)}")
-            listbox.event_data = []
-        finally:
-            refresh_button.config(text="Refresh Events", state=tk.NORMAL)
+            listbox.after(0, show_events, [], str(e))
+    
+    if cached is not None:
+        fill_listbox(cached[0])
+        refresh_button.config(text="Refreshing...", state=tk.DISABLED)
     
     # Run in thread to avoid blocking UI
     thread = threading.Thread(target=refresh_worker, daemon=True)
@@ -513,37 +886,36 @@ def auto_fill_from_selection(listbox, ui_elements):
     ui_elements['description_entry'].insert(0, event['auto_description'])
 
 
+# Compiled once; extract_notion_url runs for every calendar event shown
+# Anchor tags are replaced by their href so link text can't run into the URL
+HTML_ANCHOR_RE = re.compile(r'<a\b[^>]*?\bhref="([^"]*)"[^>]*>|</a\s*>', re.IGNORECASE)
+NOTION_URL_RE = re.compile(r'https://(?:www\.)?notion\.so/[^\s<>"]+')
+NOTION_P_PARAM_RE = re.compile(r'[?&]p=([a-f0-9]{32})', re.IGNORECASE)
+NOTION_PATH_ID_RE = re.compile(r'/[^/]+/([a-f0-9]{32})', re.IGNORECASE)
+HEX32_RE = re.compile(r'[a-f0-9]{32}', re.IGNORECASE)
+
+
 def extract_notion_url(description_text):
     """Extract Notion page ID from p= parameter or URL structure"""
     if not description_text:
         return ""
     
-    import re
-    
     # Remove HTML tags and decode entities
-    clean_text = description_text.replace('<a href="', '').replace('">', '').replace('</a>', '')
-    clean_text = clean_text.replace('&amp;', '&')
+    clean_text = html.unescape(HTML_ANCHOR_RE.sub(r'\1 ', description_text))
     
     logging.debug(f"[URL Extract] Processing description: {clean_text[:150]}...")
     
     # Find Notion URLs first
-    notion_url_patterns = [
-        r'https://www\.notion\.so/[^\s<>"]+',
-        r'https://notion\.so/[^\s<>"]+',
-    ]
-    
     notion_url = None
-    for pattern in notion_url_patterns:
-        matches = re.findall(pattern, clean_text)
-        if matches:
-            # Get the last/longest match
-            notion_url = matches[-1]
-            logging.debug(f"[URL Extract] Found Notion URL: {notion_url}")
-            break
+    matches = NOTION_URL_RE.findall(clean_text)
+    if matches:
+        # Get the last/longest match
+        notion_url = matches[-1]
+        logging.debug(f"[URL Extract] Found Notion URL: {notion_url}")
     
     if notion_url:
         # First priority: Look for p= parameter (this contains the actual page ID)
-        p_param_match = re.search(r'[?&]p=([a-f0-9]{32})', notion_url, re.IGNORECASE)
+        p_param_match = NOTION_P_PARAM_RE.search(notion_url)
         if p_param_match:
             page_id = p_param_match.group(1)
             clean_url = f"https://www.notion.so/{page_id}"
@@ -552,7 +924,7 @@ def extract_notion_url(description_text):
             return clean_url
         
         # Second priority: Look for page ID directly in path (like /rooche/32chars)
-        path_match = re.search(r'/[^/]+/([a-f0-9]{32})', notion_url, re.IGNORECASE)
+        path_match = NOTION_PATH_ID_RE.search(notion_url)
         if path_match:
             page_id = path_match.group(1)
             clean_url = f"https://www.notion.so/{page_id}"
@@ -561,7 +933,7 @@ def extract_notion_url(description_text):
             return clean_url
         
         # Third priority: Any 32-char hex string in the URL (use the first one found)
-        hex_matches = re.findall(r'[a-f0-9]{32}', notion_url, re.IGNORECASE)
+        hex_matches = HEX32_RE.findall(notion_url)
         if hex_matches:
             # Use the first one found (usually the main page ID)
             page_id = hex_matches[0]
@@ -571,8 +943,7 @@ def extract_notion_url(description_text):
             return clean_url
     
     # Final fallback: look for any 32-character hex string in the entire text
-    hex_pattern = r'[a-f0-9]{32}'
-    hex_matches = re.findall(hex_pattern, clean_text, re.IGNORECASE)
+    hex_matches = HEX32_RE.findall(clean_text)
     
     if hex_matches:
         # Use the first one found
@@ -586,31 +957,36 @@ def extract_notion_url(description_text):
 
 
 def extract_audio(file_path, status_callback):
-    """Extract audio from video/audio file and return path to extracted audio"""
+    """Extract audio with ffmpeg piped straight into memory as 16 kHz mono float32 samples"""
     status_callback("🎧 Extracting audio from file...")
-    logging.debug(f"[Audio] Starting audio extraction from: {file_path}")
+    logging.debug(f"[Audio] Piping audio from ffmpeg for: {file_path}")
     
-    temp_audio_path = tempfile.mktemp(suffix=".wav")
     try:
-        subprocess.run(
-            ["ffmpeg", "-y", "-i", file_path, "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1", temp_audio_path],
+        import numpy as np
+        
+        result = subprocess.run(
+            ["ffmpeg", "-nostdin", "-loglevel", "error", "-i", file_path, "-vn",
+             "-f", "s16le", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1", "-"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             check=True
         )
+        # Scale in place: a 1 h recording is ~230 MB as float32, so skip the extra copy
+        audio = np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32)
+        audio *= 1.0 / 32768.0
         
-        if os.path.exists(temp_audio_path):
-            logging.debug(f"[Audio] Audio extracted successfully to: {temp_audio_path}")
+        if audio.size:
+            logging.debug(f"[Audio] Extracted {audio.size / 16000:.1f}s of audio")
             status_callback("✅ Audio extraction completed!")
-            return temp_audio_path
+            return audio
         else:
-            logging.error("[Audio] Audio file not created")
-            status_callback("❌ Audio extraction failed - no output file")
+            logging.error("[Audio] ffmpeg produced no audio samples")
+            status_callback("❌ Audio extraction failed - no audio stream")
             return None
             
     except subprocess.CalledProcessError as e:
-        logging.error(f"[Audio] Error extracting audio: {e.stderr.decode()}")
-        status_callback(f"❌ Audio extraction failed: {e.stderr.decode()}")
+        logging.error(f"[Audio] Error extracting audio: {e.stderr.decode(errors='replace')}")
+        status_callback(f"❌ Audio extraction failed: {e.stderr.decode(errors='replace')}")
         return None
     except Exception as e:
         logging.error(f"[Audio] Unexpected error during audio extraction: {e}")
@@ -618,47 +994,156 @@ def extract_audio(file_path, status_callback):
         return None
 
 
-def transcribe_locally(audio_file_path: str, status_callback) -> Optional[str]:
-    """Transcribe audio file using local Whisper model"""
+@functools.lru_cache(maxsize=1)
+def cuda_available():
+    """Probe once whether CTranslate2 can see a CUDA device"""
     try:
-        status_callback("🎯 Starting local transcription...")
-        logging.debug(f"[Whisper] Starting transcription of: {audio_file_path}")
-        
-        if not os.path.exists(audio_file_path):
-            status_callback("❌ Audio file not found")
-            return None
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception as e:
+        logging.debug(f"[Whisper] CUDA probe failed, using CPU: {e}")
+        return False
+
+
+def resolve_whisper_device():
+    """Return the configured device, picking cuda or cpu when set to auto"""
+    device = (config.get("whisper_device") or "auto").strip()
+    if device == "auto":
+        return "cuda" if cuda_available() else "cpu"
+    return device
+
+
+# CTranslate2 compute type used when whisper_compute_type is "auto"
+# (same defaults as core.constants, so both apps pick the same type on the same machine)
+AUTO_COMPUTE_TYPES = {
+    "cuda": "int8_float16",
+    "cpu": "int8",
+}
+
+
+# Speech chunks decoded together by the batched pipeline on GPU
+WHISPER_BATCH_SIZE = 8
+
+
+def resolve_whisper_model_key():
+    """Return the (model, device, compute_type) the current settings ask for"""
+    device = resolve_whisper_device()
+    compute_type = (config.get("whisper_compute_type") or "auto").strip()
+    if compute_type == "auto":
+        # Quantized weights: int8 on CPU, int8 weights with fp16 activations on GPU
+        compute_type = AUTO_COMPUTE_TYPES["cuda" if device.startswith("cuda") else "cpu"]
+    return (config.get("whisper_model", "base"), device, compute_type)
+
+
+# One Whisper model shared by the monitoring and manual-tab threads, reloaded
+# only when the model, device or compute type setting changes
+whisper_model = None
+whisper_model_key = None
+whisper_pipeline = None
+whisper_model_lock = threading.Lock()
+# Held for a whole transcription so parallel jobs queue for the GPU/CPU instead of thrashing it
+whisper_transcribe_lock = threading.Lock()
+
+
+def get_whisper_model():
+    """Return the loaded Whisper model for the current settings, loading it on first use"""
+    global whisper_model, whisper_model_key
+    key = resolve_whisper_model_key()
+    with whisper_model_lock:
+        if whisper_model is None or whisper_model_key != key:
+            # Imported on first use: faster-whisper pulls in ctranslate2 and is slow to import
+            from faster_whisper import WhisperModel
+            
+            name, device, compute_type = key
+            logging.debug(f"[Whisper] Loading model '{name}' on {device} ({compute_type})")
+            # Drop the old model first so two sets of weights are never held at once
+            whisper_model = None
+            whisper_model = WhisperModel(name, device=device, compute_type=compute_type)
+            whisper_model_key = key
+        return whisper_model
+
+
+def get_whisper_pipeline():
+    """Return a batched pipeline over the shared model, rebuilt only when the model is"""
+    global whisper_pipeline
+    model = get_whisper_model()
+    with whisper_model_lock:
+        if whisper_pipeline is None or whisper_pipeline.model is not model:
+            from faster_whisper import BatchedInferencePipeline
             
-        file_size = os.path.getsize(audio_file_path)
-        logging.debug(f"[Whisper] Audio file size: {file_size} bytes")
+            whisper_pipeline = BatchedInferencePipeline(model=model)
+        return whisper_pipeline
 
-        output_dir = tempfile.mkdtemp()
-        logging.debug(f"[Whisper] Using temporary directory: {output_dir}")
 
+# (model, device, compute_type) whose preload failed, so a broken setup isn't retried in the background
+whisper_preload_failed_key = None
+
+
+def preload_whisper_model():
+    """Load the Whisper model in the background so the first transcription skips the load"""
+    def preload_worker():
+        global whisper_preload_failed_key
+        # Resolved here: probing for CUDA imports ctranslate2, which is slow
+        model_key = resolve_whisper_model_key()
+        if model_key == whisper_preload_failed_key:
+            return
         try:
-            transcribe_anything(
-                url_or_file=audio_file_path,
-                output_dir=output_dir,
-                task="transcribe",
-                model=config.get("whisper_model", "base"),
-                device=config.get("whisper_device", "cpu"),
-                language=None
-            )
-            
-            base_name = "out"
-            output_txt = os.path.join(output_dir, f"{base_name}.txt")
+            get_whisper_model()
+            logging.debug("[Whisper] Model preloaded")
+        except Exception as e:
+            whisper_preload_failed_key = model_key
+            logging.warning(f"[Whisper] Failed to preload model: {e}")
+    
+    threading.Thread(target=preload_worker, daemon=True).start()
+
+
+# Manual-tab files run here so ffmpeg can decode one file while another is transcribed.
+# Its workers are joined at interpreter exit, so closing the window waits for them.
+manual_executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                     thread_name_prefix="manual-process")
+# Submitted manual-tab jobs that haven't finished yet
+manual_futures = set()
+
+
+def transcribe_locally(audio, status_callback) -> Optional[str]:
+    """Transcribe decoded 16 kHz samples using local Whisper model"""
+    try:
+        status_callback("🎯 Starting local transcription...")
+        logging.debug(f"[Whisper] Starting transcription of {audio.size / 16000:.1f}s of audio")
+
+        try:
+            with whisper_transcribe_lock:
+                if resolve_whisper_device().startswith("cuda"):
+                    # VAD-split speech chunks decoded in batches; CPU runs usually do better unbatched
+                    segments, info = get_whisper_pipeline().transcribe(
+                        audio,
+                        task="transcribe",
+                        language=None,
+                        beam_size=1,
+                        batch_size=WHISPER_BATCH_SIZE,
+                        vad_filter=True
+                    )
+                else:
+                    # Greedy decoding and skipping silence keep CPU runs fast
+                    segments, info = get_whisper_model().transcribe(
+                        audio,
+                        task="transcribe",
+                        language=None,
+                        beam_size=1,
+                        vad_filter=True
+                    )
+                logging.debug(f"[Whisper] Detected language: {info.language}")
+                transcription_text = "\n".join(segment.text.strip() for segment in segments)
             
-            if os.path.exists(output_txt):
-                with open(output_txt, "r", encoding="utf-8") as f:
-                    transcription_text = f.read()
-                
+            if transcription_text:
                 status_callback("✅ Transcription completed!")
                 logging.debug(f"[Whisper] Transcription completed successfully: {transcription_text[:100]}...")
                 return transcription_text
             else:
-                status_callback("❌ Transcription output not found")
-                logging.error("[Whisper] No output text file found")
+                status_callback("❌ Transcription output is empty")
+                logging.error("[Whisper] No speech transcribed")
                 return None
-                
+            
         except Exception as e:
             logging.error(f"[Whisper] Transcription failed: {e}")
             status_callback(f"❌ Local transcription failed: {str(e)}")
@@ -673,21 +1158,12 @@ def transcribe_locally(audio_file_path: str, status_callback) -> Optional[str]:
 def process_audio_file(file_path, status_callback):
     """Process audio/video file: extract audio first, then transcribe"""
     try:
-        audio_path = extract_audio(file_path, status_callback)
-        if not audio_path or not os.path.exists(audio_path):
+        audio = extract_audio(file_path, status_callback)
+        if audio is None:
             status_callback("❌ Failed to extract audio")
             return None
 
-        transcription = transcribe_locally(audio_path, status_callback)
-        
-        try:
-            if os.path.exists(audio_path):
-                os.remove(audio_path)
-                logging.debug(f"[Cleanup] Removed temporary audio file: {audio_path}")
-        except Exception as e:
-            logging.warning(f"[Cleanup] Failed to remove temporary file: {e}")
-
-        return transcription
+        return transcribe_locally(audio, status_callback)
         
     except Exception as e:
         logging.error(f"[Process] Error processing audio file: {e}")
@@ -695,44 +1171,60 @@ def process_audio_file(file_path, status_callback):
         return None
 
 
+# (path, mtime_ns, size) of the last parsed history and its entries, so refreshing
+# the recent files list doesn't re-parse a history that hasn't changed
+recent_history_cache = (None, [])
+
+
 def get_recent_audio_video_files(hours_back=24):
     """Get recent audio/video files from ShareX history"""
-    if not config.get("history_path") or not os.path.exists(config["history_path"]):
+    global recent_history_cache
+    history_path = config.get("history_path")
+    if not history_path:
         return []
     
     try:
-        with open(config["history_path"], 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        raw_entries = "[" + content.replace("}\n{", "},\n{") + "]"
-        history = json.loads(raw_entries)
+        try:
+            stat = os.stat(history_path)
+            cache_key = (history_path, stat.st_mtime_ns, stat.st_size)
+            cached_key, history = recent_history_cache
+            if cache_key != cached_key:
+                with open(history_path, 'rb') as f:
+                    content = f.read().decode('utf-8', errors='replace')
+                history, _ = parse_history_entries(content)
+                # Swapped as one tuple so a concurrent refresh never sees a mismatched pair
+                recent_history_cache = (cache_key, history)
+        except FileNotFoundError:
+            return []
         
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
         audio_video_files = []
         
-        valid_ext = ['.mp3', '.mp4', '.wav', '.m4a', '.flac', '.ogg', '.webm', '.avi', '.mov', '.wmv']
-        
         for entry in reversed(history):
             if "FilePath" in entry and "DateTime" in entry and "FileName" in entry:
                 try:
-                    entry_time = datetime.fromisoformat(entry["DateTime"].replace("Z", "+00:00"))
-                    if entry_time.tzinfo is None:
-                        entry_time = entry_time.replace(tzinfo=timezone.utc)
+                    entry_time = parse_iso_datetime(entry["DateTime"])
                     
-                    if entry_time > cutoff_time:
-                        file_name = entry.get("FileName", "").lower()
-                        if any(file_name.endswith(ext) for ext in valid_ext):
-                            local_time = entry_time.astimezone()
-                            time_str = local_time.strftime("%Y-%m-%d %I:%M:%S %p")
-                            
-                            audio_video_files.append({
-                                'filename': entry.get("FileName", "Unknown"),
-                                'filepath': entry.get("FilePath", ""),
-                                'url': entry.get("URL", ""),
-                                'datetime': entry_time,
-                                'display_time': time_str,
-                                'display_text': f"{time_str} - {entry.get('FileName', 'Unknown')}"
-                            })
+                    # History is chronological; everything further back is older
+                    if entry_time <= cutoff_time:
+                        break
+                    
+                    file_name = entry.get("FileName", "").lower()
+                    if file_name.endswith(VALID_AUDIO_VIDEO_EXTENSIONS):
+                        local_time = entry_time.astimezone()
+                        time_str = local_time.strftime("%Y-%m-%d %I:%M:%S %p")
+                        
+                        audio_video_files.append({
+                            'filename': entry.get("FileName", "Unknown"),
+                            'filepath': entry.get("FilePath", ""),
+                            'url': entry.get("URL", ""),
+                            'datetime': entry_time,
+                            'display_time': time_str,
+                            'display_text': f"{time_str} - {entry.get('FileName', 'Unknown')}"
+                        })
+                        # Only the 20 newest are listed; skip formatting the rest
+                        if len(audio_video_files) >= 20:
+                            break
                 except Exception as e:
                     logging.warning(f"[History] Error parsing entry: {e}")
                     continue
@@ -748,6 +1240,7 @@ def stop_monitoring(status_callback, ui_elements):
     """Stop the monitoring process and re-enable UI"""
     global monitoring_active
     monitoring_active = False
+    history_changed.set()
     
     # Stop ShareX recording
     if stop_sharex_recording():
@@ -768,6 +1261,7 @@ def enable_ui_elements(ui_elements, enable=True):
     ui_elements['timer_entry'].config(state=state)
     ui_elements['model_entry'].config(state=state)
     ui_elements['device_entry'].config(state=state)
+    ui_elements['compute_type_entry'].config(state=state)
     ui_elements['submit_button'].config(state=state)
     ui_elements['select_button'].config(state=state)
     ui_elements['pass_fail_button'].config(state=state)
@@ -784,105 +1278,171 @@ def wait_for_audio_video_upload_with_timeout(after_dt: datetime, timeout_minutes
     monitoring_active = True
     start_time = datetime.now()
     timeout_seconds = timeout_minutes * 60
+    start_monitor_time = time.monotonic()
+    # Any widget works as a handle for scheduling on the Tk event loop
+    tk_widget = ui_elements['reset_button']
+    last_countdown_text = None
+    # Current history read error, kept so the countdown can keep showing it
+    last_error_text = None
     
     logging.debug(f"[Monitor] Starting monitoring with {timeout_minutes} minute timeout")
     logging.debug(f"[Monitor] Watching for uploads after {after_dt.isoformat()}")
 
+    def restore_ui():
+        # Tk widgets may only be touched from the main thread
+        tk_widget.after(0, enable_ui_elements, ui_elements, True)
+
+    def countdown_tick():
+        """Show the remaining time; runs on the Tk event loop, not the worker"""
+        nonlocal last_countdown_text
+        if not monitoring_active:
+            return
+        remaining_seconds = max(0, int(timeout_seconds - (time.monotonic() - start_monitor_time)))
+        hours, rest = divmod(remaining_seconds, 3600)
+        minutes, seconds = divmod(rest, 60)
+        
+        if hours > 0:
+            time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        else:
+            time_str = f"{minutes:02d}:{seconds:02d}"
+        
+        # after() drifts, so two ticks can land in the same second; skip the redraw then
+        countdown_text = f"👀 Monitoring for uploads... {time_str} remaining"
+        if last_error_text:
+            countdown_text += f"\n{last_error_text}"
+        if countdown_text != last_countdown_text:
+            last_countdown_text = countdown_text
+            status_callback(countdown_text)
+        tk_widget.after(1000, countdown_tick)
+
     def monitoring_worker():
+        observer = start_history_observer(config["history_path"])
+        try:
+            scan_history_until_timeout(observer is not None)
+        finally:
+            if observer:
+                observer.stop()
+                observer.join()
+        
+        if not monitoring_active:
+            restore_ui()
+    
+    def scan_history_until_timeout(watching):
         global monitoring_active
-        start_monitor_time = time.time()
-        last_display_time = 0
+        nonlocal last_error_text
+        history_offset = 0
+        history_changed.clear()
+        # Without watchdog, poll quickly after activity and back off while the history is idle
+        poll_max = max(POLL_MIN_SECONDS, float(config.get("poll_interval_seconds", 5)))
+        poll_seconds = POLL_MIN_SECONDS
         
         while monitoring_active:
-            current_time = time.time()
-            elapsed_seconds = current_time - start_monitor_time
-            
-            if elapsed_seconds >= timeout_seconds:
+            remaining = timeout_seconds - (time.monotonic() - start_monitor_time)
+            if remaining <= 0:
                 monitoring_active = False
                 status_callback("⏰ Time limit reached - monitoring stopped")
-                enable_ui_elements(ui_elements, True)
+                restore_ui()
                 logging.debug("[Monitor] Timeout reached, stopping monitoring")
                 return
             
-            remaining_seconds = int(timeout_seconds - elapsed_seconds)
-            
-            if int(current_time) != last_display_time:
-                last_display_time = int(current_time)
-                
-                hours = remaining_seconds // 3600
-                minutes = (remaining_seconds % 3600) // 60
-                seconds = remaining_seconds % 60
-                
-                if hours > 0:
-                    time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                else:
-                    time_str = f"{minutes:02d}:{seconds:02d}"
-                
-                status_callback(f"👀 Monitoring for uploads... {time_str} remaining")
-            
+            history_changed.clear()
+            previous_offset = history_offset
             try:
-                with open(config["history_path"], 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                raw_entries = "[" + content.replace("}\n{", "},\n{") + "]"
-                history = json.loads(raw_entries)
+                history, history_offset = read_new_history_entries(config["history_path"], history_offset)
 
-                for entry in reversed(history):
+                # Only appended entries arrive here, so walk them in upload order
+                for entry in history:
                     if not monitoring_active:
                         return
-                        
+                    
                     if "FilePath" in entry and "DateTime" in entry:
-                        entry_time = datetime.fromisoformat(entry["DateTime"].replace("Z", "+00:00"))
-                        if entry_time.tzinfo is None:
-                            entry_time = entry_time.replace(tzinfo=timezone.utc)
+                        # Cheap suffix check first so only candidates pay for datetime parsing
+                        file_name = entry.get("FileName", "").lower()
+                        if not file_name.endswith(VALID_AUDIO_VIDEO_EXTENSIONS):
+                            continue
+                        
+                        entry_time = parse_iso_datetime(entry["DateTime"])
                         if entry_time > after_dt:
                             logging.debug(f"[Monitor] New file found: {entry['FileName']}")
-                            file_name = entry.get("FileName", "").lower()
-                            valid_ext = ['.mp3', '.mp4', '.wav', '.m4a', '.flac', '.ogg', '.webm', '.avi', '.mov', '.wmv']
-                            if any(file_name.endswith(ext) for ext in valid_ext):
-                                monitoring_active = False
-                                status_callback("🎬 Found audio/video file!")
-                                
-                                local_file_path = entry["FilePath"]
-                                if os.path.exists(local_file_path):
-                                    transcription = process_audio_file(local_file_path, status_callback)
-                                    if transcription:
-                                        drive_url = entry.get("URL", "")
-                                        callback(transcription, drive_url, local_file_path)
-                                        enable_ui_elements(ui_elements, True)
-                                        return
-                                    else:
-                                        status_callback("❌ File processing failed")
-                                        enable_ui_elements(ui_elements, True)
-                                        return
+                            monitoring_active = False
+                            status_callback("🎬 Found audio/video file!")
+                            
+                            local_file_path = entry["FilePath"]
+                            if os.path.exists(local_file_path):
+                                transcription = process_audio_file(local_file_path, status_callback)
+                                if transcription:
+                                    drive_url = entry.get("URL", "")
+                                    callback(transcription, drive_url, local_file_path)
+                                    restore_ui()
+                                    return
                                 else:
-                                    status_callback(f"❌ File not found: {local_file_path}")
-                                    enable_ui_elements(ui_elements, True)
+                                    status_callback("❌ File processing failed")
+                                    restore_ui()
                                     return
                             else:
-                                logging.debug(f"[Monitor] Ignoring non-audio/video file: {file_name}")
-                                continue
+                                status_callback(f"❌ File not found: {local_file_path}")
+                                restore_ui()
+                                return
 
+                last_error_text = None
             except Exception as e:
-                logging.error(f"[Monitor] Error reading history: {e}")
-                status_callback(f"⚠️ Error reading history: {str(e)}")
+                # A broken history fails the same way on every poll; log it once, the countdown keeps showing it
+                error_text = f"⚠️ Error reading history: {str(e)}"
+                if error_text != last_error_text:
+                    last_error_text = error_text
+                    logging.error(f"[Monitor] Error reading history: {e}")
+                    status_callback(error_text)
+
+            if history_offset != previous_offset:
+                poll_seconds = POLL_MIN_SECONDS
+            else:
+                poll_seconds = min(poll_seconds * POLL_BACKOFF, poll_max)
 
-            time.sleep(1)
-        
-        if not monitoring_active:
-            enable_ui_elements(ui_elements, True)
+            # Sleep until the history changes, monitoring stops or the time limit hits;
+            # with watchdog the timeout only guards against a missed event
+            history_changed.wait(min(remaining, 5 if watching else poll_seconds))
     
     global monitoring_thread
     monitoring_thread = threading.Thread(target=monitoring_worker, daemon=True)
     monitoring_thread.start()
+    countdown_tick()
+
+
+# Outcomes of send_to_webhook
+WEBHOOK_SENT = "sent"
+WEBHOOK_RETRY = "retry"              # never reached n8n; safe to send again
+WEBHOOK_UNCONFIRMED = "unconfirmed"  # may have been processed; resending risks a duplicate
+WEBHOOK_FAILED = "failed"            # rejected; resending won't help
+WEBHOOK_NO_URL = "no_url"
+# Gateway answers that mean the request was not handed to the workflow
+WEBHOOK_RETRY_STATUSES = (502, 503)
+
+
+def webhook_send_outcome(error):
+    """Classify a failed POST by whether n8n could already have processed it"""
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code
+        if status in WEBHOOK_RETRY_STATUSES:
+            return WEBHOOK_RETRY
+        # 504 means the proxy gave up waiting, not that the workflow didn't run
+        return WEBHOOK_UNCONFIRMED if status == 504 else WEBHOOK_FAILED
+    if isinstance(error, requests.ConnectTimeout):
+        return WEBHOOK_RETRY
+    if isinstance(error, requests.ConnectionError):
+        # Only a failure to connect is safe; a connection dropped mid-response is not
+        cause = error.args[0] if error.args else None
+        if isinstance(getattr(cause, "reason", cause), NewConnectionError):
+            return WEBHOOK_RETRY
+    # Read timeouts and dropped connections: the POST went out, the answer didn't come back
+    return WEBHOOK_UNCONFIRMED
 
 
 def send_to_webhook(notion_url, description, transcription=None, drive_url=None, local_file_path=None, result=None, reason=None):
-    """Send data to webhook with optional pass/fail result"""
-    webhook_url = os.getenv("WEBHOOK_URL", "").strip()
+    """Send data to webhook with optional pass/fail result; returns a WEBHOOK_* outcome"""
+    webhook_url = WEBHOOK_URL
     if not webhook_url:
         logging.warning("[Webhook] No webhook URL configured in .env file.")
-        return
+        return WEBHOOK_NO_URL
 
     logging.debug("[Webhook] Sending data to webhook...")
     data = {
@@ -905,13 +1465,18 @@ def send_to_webhook(notion_url, description, transcription=None, drive_url=None,
         data["reason"] = reason
     
     try:
-        res = requests.post(webhook_url, json=data)
+        res = http_session.post(
+            webhook_url,
+            data=json_dumps(data),
+            headers={"Content-Type": "application/json"},
+            timeout=WEBHOOK_TIMEOUT
+        )
         res.raise_for_status()
         logging.debug("[Webhook] Sent successfully.")
-        return True
+        return WEBHOOK_SENT
     except Exception as e:
         logging.error(f"[Webhook] Failed to send: {e}")
-        return False
+        return webhook_send_outcome(e)
 
 def handle_start_recording(status_label):
     """Manually start ShareX screen recording"""
@@ -924,6 +1489,131 @@ def handle_start_recording(status_label):
             messagebox.showerror("Error", "pynput library not installed.\nInstall with: pip install pynput")
 
 
+# Transcripts not yet delivered; mirrored to disk so an outage or crash doesn't lose them
+WEBHOOK_PENDING_FILE = "webhook_pending.json"
+WEBHOOK_MAX_ATTEMPTS = 5
+# Longest exit waits for a send already in flight (connect retries plus the read timeout)
+WEBHOOK_EXIT_WAIT_SECONDS = 60
+webhook_queue = queue.Queue()
+webhook_pending = []
+# Pending payloads that found no WEBHOOK_URL, waiting for File > Reload .env
+webhook_parked = []
+webhook_pending_lock = threading.Lock()
+webhook_worker = None
+webhook_stopping = threading.Event()
+
+
+def save_webhook_pending():
+    """Write the undelivered payloads; caller holds webhook_pending_lock"""
+    try:
+        temp_path = WEBHOOK_PENDING_FILE + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(webhook_pending, f)
+        os.replace(temp_path, WEBHOOK_PENDING_FILE)
+    except Exception as e:
+        logging.warning(f"[Webhook] Could not save pending sends: {e}")
+
+
+def queue_webhook_send(payload, status_callback=None):
+    """Deliver send_to_webhook(**payload) from the background sender, retrying with backoff"""
+    global webhook_worker
+    with webhook_pending_lock:
+        webhook_pending.append(payload)
+        save_webhook_pending()
+        if webhook_worker is None:
+            webhook_worker = threading.Thread(target=webhook_worker_loop, daemon=True)
+            webhook_worker.start()
+    webhook_queue.put((payload, status_callback))
+
+
+def report_webhook_status(status_callback, message):
+    """Pass a status to the UI; after the window is gone the sender keeps going silently"""
+    if status_callback and not webhook_stopping.is_set():
+        try:
+            status_callback(message)
+        except (RuntimeError, tk.TclError):
+            pass
+
+
+def webhook_worker_loop():
+    while True:
+        item = webhook_queue.get()
+        if item is None or webhook_stopping.is_set():
+            # Exiting: anything not sent yet stays in the pending file for the next start
+            return
+        payload, status_callback = item
+        # Only resend when the webhook certainly never saw the request
+        for attempt in range(WEBHOOK_MAX_ATTEMPTS):
+            outcome = send_to_webhook(**payload)
+            if outcome != WEBHOOK_RETRY:
+                break
+            if attempt < WEBHOOK_MAX_ATTEMPTS - 1 and webhook_stopping.wait(2 ** attempt):
+                break
+
+        if outcome == WEBHOOK_RETRY:
+            # Left in the pending file; resume_pending_webhook_sends picks it up next start
+            logging.error("[Webhook] Could not reach the webhook; keeping the transcript for the next start")
+            report_webhook_status(status_callback, "❌ Could not reach the webhook; will retry on next start")
+            continue
+        if outcome == WEBHOOK_NO_URL:
+            # Kept pending; File > Reload .env sends it once the URL is set
+            with webhook_pending_lock:
+                webhook_parked.append(payload)
+            report_webhook_status(status_callback, "❌ WEBHOOK_URL not set in .env - transcription kept, use File > Reload .env")
+            continue
+
+        with webhook_pending_lock:
+            webhook_pending.remove(payload)
+            save_webhook_pending()
+        if outcome == WEBHOOK_UNCONFIRMED:
+            logging.warning("[Webhook] Transcript sent but not confirmed; not resending to avoid a duplicate")
+        report_webhook_status(status_callback, {
+            WEBHOOK_SENT: "✅ Transcription sent to webhook!",
+            WEBHOOK_UNCONFIRMED: "⚠️ Transcription sent, but the webhook did not confirm it in time",
+            WEBHOOK_FAILED: "❌ Webhook rejected the transcription",
+        }[outcome])
+
+
+def resend_parked_webhook_sends():
+    """Queue transcripts that were held back because WEBHOOK_URL was not set"""
+    with webhook_pending_lock:
+        parked = webhook_parked[:]
+        webhook_parked.clear()
+    if parked:
+        logging.debug(f"[Webhook] Sending {len(parked)} transcripts held for a missing URL")
+    for payload in parked:
+        webhook_queue.put((payload, None))
+
+
+def stop_webhook_sender():
+    """Let an in-flight send finish before exit; queued ones stay pending for the next start"""
+    webhook_stopping.set()
+    if webhook_worker is not None:
+        # Wakes an idle worker; a busy one sees webhook_stopping after its current send
+        webhook_queue.put(None)
+        webhook_worker.join(WEBHOOK_EXIT_WAIT_SECONDS)
+
+
+def resume_pending_webhook_sends():
+    """Queue transcripts that an earlier session could not deliver"""
+    try:
+        with open(WEBHOOK_PENDING_FILE, "r") as f:
+            pending = json.load(f)
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        logging.warning(f"[Webhook] Ignoring unreadable pending sends: {e}")
+        return
+
+    with webhook_pending_lock:
+        webhook_pending.clear()
+        save_webhook_pending()
+    if pending:
+        logging.debug(f"[Webhook] Resending {len(pending)} pending transcripts")
+    for payload in pending:
+        queue_webhook_send(payload)
+
+
 def handle_stop_recording(status_label):
     """Manually stop ShareX screen recording"""
     if stop_sharex_recording():
@@ -942,7 +1632,7 @@ def handle_pass_fail(ui_elements, status_label, root):
         messagebox.showerror("Error", "Please enter both Notion URL and description before submitting pass/fail.")
         return
 
-    webhook_url = os.getenv("WEBHOOK_URL", "").strip()
+    webhook_url = WEBHOOK_URL
     if not webhook_url:
         messagebox.showerror("Error", "Webhook URL not set in .env file.")
         return
@@ -955,18 +1645,25 @@ def handle_pass_fail(ui_elements, status_label, root):
         # Send to webhook
         status_label.config(text="📤 Sending pass/fail result...")
         
-        success = send_to_webhook(
-            notion_url=notion_url,
-            description=description,
-            result=result,
-            reason=reason
-        )
+        # Post off the Tk thread so a slow network doesn't freeze the window
+        def send_worker():
+            outcome = send_to_webhook(
+                notion_url=notion_url,
+                description=description,
+                result=result,
+                reason=reason
+            )
+            
+            if outcome == WEBHOOK_SENT:
+                message = f"✅ {result.title()} result sent successfully!"
+                logging.info(f"[PassFail] Sent {result} result: {reason}")
+            elif outcome == WEBHOOK_UNCONFIRMED:
+                message = f"⚠️ {result.title()} result sent, but the webhook did not confirm it in time"
+            else:
+                message = "❌ Failed to send pass/fail result"
+            status_label.after(0, lambda: status_label.config(text=message))
         
-        if success:
-            status_label.config(text=f"✅ {result.title()} result sent successfully!")
-            logging.info(f"[PassFail] Sent {result} result: {reason}")
-        else:
-            status_label.config(text="❌ Failed to send pass/fail result")
+        threading.Thread(target=send_worker, daemon=True).start()
     else:
         status_label.config(text="❌ Pass/fail submission cancelled")
 
@@ -983,7 +1680,7 @@ def handle_submission(ui_elements, status_label):
         messagebox.showerror("Error", "No ShareX history.json selected.")
         return
 
-    webhook_url = os.getenv("WEBHOOK_URL", "").strip()
+    webhook_url = WEBHOOK_URL
     if not webhook_url:
         messagebox.showerror("Error", "Webhook URL not set in .env file.")
         return
@@ -993,17 +1690,18 @@ def handle_submission(ui_elements, status_label):
         if wait_minutes <= 0:
             messagebox.showerror("Error", "Time limit must be greater than 0 minutes.")
             return
-        config["wait_timer_minutes"] = wait_minutes
-        save_config()
     except ValueError:
         messagebox.showerror("Error", "Please enter a valid number for time limit.")
         return
 
     submit_time = datetime.now(timezone.utc).astimezone()
     
-    config["whisper_model"] = ui_elements['model_entry'].get().strip()
-    config["whisper_device"] = ui_elements['device_entry'].get().strip()
-    save_config()
+    # One deferred write (or none if the entries already match) before monitoring starts
+    update_config(
+        status_label,
+        wait_timer_minutes=wait_minutes,
+        **whisper_settings_from_ui(ui_elements),
+    )
     
     enable_ui_elements(ui_elements, False)
     
@@ -1013,12 +1711,19 @@ def handle_submission(ui_elements, status_label):
     else:
         status_label.config(text="⚠️ ShareX recording trigger failed, but monitoring for uploads...")
     
-    def on_transcription_complete(transcription, drive_url, local_file_path):
-        send_to_webhook(notion_url, description, transcription, drive_url, local_file_path)
-        status_label.config(text="✅ Transcription sent to webhook!")
-
     def status_update(message):
-        status_label.config(text=message)
+        # Called from the monitoring thread; hand the widget update to the Tk loop
+        status_label.after(0, lambda m=message: status_label.config(text=m))
+
+    def on_transcription_complete(transcription, drive_url, local_file_path):
+        status_update("📤 Sending transcription to webhook...")
+        queue_webhook_send({
+            "notion_url": notion_url,
+            "description": description,
+            "transcription": transcription,
+            "drive_url": drive_url,
+            "local_file_path": local_file_path,
+        }, status_update)
 
     status_update(f"🚀 Starting monitoring with {wait_minutes} minute time limit...")
     
@@ -1045,7 +1750,7 @@ def select_history_file(label, submit_button):
 
 
 def update_submit_button_state(submit_button):
-    if config.get("history_path") and os.getenv("WEBHOOK_URL", "").strip():
+    if config.get("history_path") and WEBHOOK_URL:
         submit_button.config(state=tk.NORMAL)
     else:
         submit_button.config(state=tk.DISABLED)
@@ -1053,11 +1758,22 @@ def update_submit_button_state(submit_button):
 
 def create_gui():
     load_config()
+    resume_pending_webhook_sends()
+    preload_whisper_model()
 
     root = tk.Tk()
     root.title("Calendar-Integrated ShareX Monitor")
     root.geometry("700x1000")  # Slightly taller for new buttons
 
+    # Persistent warning while WEBHOOK_URL is missing, rather than a dialog per click
+    env_banner = tk.Label(
+        root,
+        text="⚠️ WEBHOOK_URL is not set in .env - submitting is disabled (File > Reload .env after fixing)",
+        bg=COLOR_RED,
+        fg="white",
+        font=FONT_BOLD_10
+    )
+
     # Create notebook for tabs
     notebook = ttk.Notebook(root)
     notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -1066,7 +1782,7 @@ def create_gui():
     calendar_frame = ttk.Frame(notebook)
     notebook.add(calendar_frame, text="📅 Calendar Events")
 
-    tk.Label(calendar_frame, text="Upcoming Calendar Events:", font=("Arial", 12, "bold")).pack(pady=(10, 5))
+    tk.Label(calendar_frame, text="Upcoming Calendar Events:", font=FONT_BOLD_12).pack(pady=(10, 5))
 
     # Calendar events listbox
     cal_listbox_frame = tk.Frame(calendar_frame)
@@ -1075,34 +1791,35 @@ def create_gui():
     cal_scrollbar = tk.Scrollbar(cal_listbox_frame)
     cal_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-    cal_listbox = tk.Listbox(cal_listbox_frame, yscrollcommand=cal_scrollbar.set, height=10, font=("Arial", 9))
+    cal_listbox = tk.Listbox(cal_listbox_frame, yscrollcommand=cal_scrollbar.set, height=10, font=FONT_9)
     cal_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    cal_listbox.event_data = []
     cal_scrollbar.config(command=cal_listbox.yview)
 
     # Calendar refresh button
     cal_refresh_button = tk.Button(
         calendar_frame,
         text="🔄 Refresh Calendar Events",
-        bg="#2196F3",
+        bg=COLOR_BLUE,
         fg="white",
-        font=("Arial", 10)
+        font=FONT_10
     )
     cal_refresh_button.pack(pady=5)
 
     # Auto-filled form section
-    form_frame = tk.LabelFrame(calendar_frame, text="Meeting Details (Auto-filled)", font=("Arial", 10, "bold"))
+    form_frame = tk.LabelFrame(calendar_frame, text="Meeting Details (Auto-filled)", font=FONT_BOLD_10)
     form_frame.pack(fill=tk.X, padx=10, pady=10)
 
     tk.Label(form_frame, text="Notion URL:").pack(pady=(10, 0))
-    notion_entry = tk.Entry(form_frame, width=80, font=("Arial", 9))
+    notion_entry = tk.Entry(form_frame, width=80, font=FONT_9)
     notion_entry.pack(pady=5)
 
     tk.Label(form_frame, text="Description:").pack()
-    description_entry = tk.Entry(form_frame, width=80, font=("Arial", 9))
+    description_entry = tk.Entry(form_frame, width=80, font=FONT_9)
     description_entry.pack(pady=5)
 
     # Configuration section
-    config_frame = tk.LabelFrame(calendar_frame, text="Configuration", font=("Arial", 10, "bold"))
+    config_frame = tk.LabelFrame(calendar_frame, text="Configuration", font=FONT_BOLD_10)
     config_frame.pack(fill=tk.X, padx=10, pady=10)
 
     tk.Label(config_frame, text="Time Limit (minutes):").pack()
@@ -1115,12 +1832,17 @@ def create_gui():
     model_entry.insert(0, config.get("whisper_model", "base"))
     model_entry.pack(pady=2)
 
-    tk.Label(config_frame, text="Device:").pack()
+    tk.Label(config_frame, text="Device (auto, cpu, cuda):").pack()
     device_entry = tk.Entry(config_frame, width=20)
-    device_entry.insert(0, config.get("whisper_device", "cpu"))
+    device_entry.insert(0, config.get("whisper_device", "auto"))
     device_entry.pack(pady=2)
 
-    status_label = tk.Label(calendar_frame, text="", fg="blue", wraplength=680, font=("Arial", 10))
+    tk.Label(config_frame, text="Compute Type (auto, int8, float16):").pack()
+    compute_type_entry = tk.Entry(config_frame, width=20)
+    compute_type_entry.insert(0, config.get("whisper_compute_type", "auto"))
+    compute_type_entry.pack(pady=2)
+
+    status_label = tk.Label(calendar_frame, text="", fg="blue", wraplength=680, font=FONT_10)
     status_label.pack(pady=10)
 
     file_label = tk.Label(calendar_frame, text="No ShareX history file selected", fg="gray")
@@ -1145,9 +1867,9 @@ def create_gui():
         first_row,
         text="🚀 Start Monitoring + Recording",
         state=tk.DISABLED,
-        bg="#4CAF50",
+        bg=COLOR_GREEN,
         fg="white",
-        font=("Arial", 10, "bold")
+        font=FONT_BOLD_10
     )
     submit_button.pack(side=tk.LEFT, padx=5)
 
@@ -1155,9 +1877,9 @@ def create_gui():
         first_row,
         text="🛑 Stop All",
         state=tk.DISABLED,
-        bg="#FF5722",
+        bg=COLOR_RED,
         fg="white",
-        font=("Arial", 9)
+        font=FONT_9
     )
     reset_button.pack(side=tk.LEFT, padx=5)
 
@@ -1168,9 +1890,9 @@ def create_gui():
     start_recording_button = tk.Button(
         second_row,
         text="🎥 Start ShareX Recording",
-        bg="#FF9800",
+        bg=COLOR_ORANGE,
         fg="white",
-        font=("Arial", 9),
+        font=FONT_9,
         padx=15
     )
     start_recording_button.pack(side=tk.LEFT, padx=5)
@@ -1180,7 +1902,7 @@ def create_gui():
         text="⏹️ Stop ShareX Recording",
         bg="#795548",
         fg="white",
-        font=("Arial", 9),
+        font=FONT_9,
         padx=15
     )
     stop_recording_button.pack(side=tk.LEFT, padx=5)
@@ -1194,7 +1916,7 @@ def create_gui():
         text="✅❌ Submit Pass/Fail Result",
         bg="#9C27B0",
         fg="white",
-        font=("Arial", 10, "bold"),
+        font=FONT_BOLD_10,
         padx=20
     )
     pass_fail_button.pack()
@@ -1206,7 +1928,7 @@ def create_gui():
              "Use manual controls for independent recording without monitoring.\n"
              "Requires: pip install pynput",
         fg="gray",
-        font=("Arial", 8),
+        font=FONT_8,
         wraplength=680
     )
     sharex_info.pack(pady=(5, 0))
@@ -1217,7 +1939,7 @@ def create_gui():
         text="Use 'Submit Pass/Fail Result' to report meeting outcomes without audio transcription.\n"
              "This is useful for meetings that failed to occur or didn't achieve their objectives.",
         fg="gray",
-        font=("Arial", 8),
+        font=FONT_8,
         wraplength=680
     )
     pass_fail_info.pack(pady=(5, 0))
@@ -1226,54 +1948,8 @@ def create_gui():
     manual_frame = ttk.Frame(notebook)
     notebook.add(manual_frame, text="📁 Manual Files")
 
-    tk.Label(manual_frame, text="Recent Audio/Video Files (Last 24 Hours):", font=("Arial", 12, "bold")).pack(pady=(10, 5))
-
-    # Create listbox with scrollbar for manual files
-    manual_listbox_frame = tk.Frame(manual_frame)
-    manual_listbox_frame.pack(pady=5, padx=10, fill=tk.BOTH, expand=True)
-
-    manual_scrollbar = tk.Scrollbar(manual_listbox_frame)
-    manual_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-    manual_listbox = tk.Listbox(manual_listbox_frame, yscrollcommand=manual_scrollbar.set, height=15, font=("Arial", 9))
-    manual_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-    manual_scrollbar.config(command=manual_listbox.yview)
-
-    # Manual refresh button
-    manual_refresh_button = tk.Button(
-        manual_frame,
-        text="🔄 Refresh File List",
-        bg="#2196F3",
-        fg="white",
-        font=("Arial", 9)
-    )
-    manual_refresh_button.pack(pady=5)
-
-    # Process selected button
-    process_selected_button = tk.Button(
-        manual_frame,
-        text="🎯 Process Selected File",
-        state=tk.DISABLED,
-        bg="#FF9800",
-        fg="white",
-        font=("Arial", 10, "bold")
-    )
-    process_selected_button.pack(pady=10)
-
-    manual_info_label = tk.Label(
-        manual_frame,
-        text="Use this tab if you forgot to start monitoring before uploading.\n"
-             "Select a recent file and click 'Process Selected File' to transcribe\n"
-             "and send it to your webhook. Make sure to fill in the meeting details\n"
-             "in the Calendar Events tab first.",
-        fg="gray",
-        font=("Arial", 8),
-        wraplength=680
-    )
-    manual_info_label.pack(pady=10)
-
     # Info section
-    info_frame = tk.LabelFrame(calendar_frame, text="ℹ️ How to Use", font=("Arial", 10, "bold"))
+    info_frame = tk.LabelFrame(calendar_frame, text="ℹ️ How to Use", font=FONT_BOLD_10)
     info_frame.pack(fill=tk.X, padx=10, pady=5)
 
     info_text = tk.Label(
@@ -1287,7 +1963,7 @@ def create_gui():
              "7. Use manual ShareX controls for independent recording\n\n"
              "⚡ Meetings starting within 30 minutes are automatically highlighted and selected!",
         fg="gray",
-        font=("Arial", 8),
+        font=FONT_8,
         justify=tk.LEFT,
         wraplength=680
     )
@@ -1300,10 +1976,10 @@ def create_gui():
         'timer_entry': timer_entry,
         'model_entry': model_entry,
         'device_entry': device_entry,
+        'compute_type_entry': compute_type_entry,
         'submit_button': submit_button,
         'select_button': select_button,
         'reset_button': reset_button,
-        'process_selected_button': process_selected_button,
         'pass_fail_button': pass_fail_button,
         'start_recording_button': start_recording_button,
         'stop_recording_button': stop_recording_button
@@ -1314,10 +1990,6 @@ def create_gui():
         command=lambda: refresh_calendar_events(cal_listbox, cal_refresh_button, ui_elements)
     )
     
-    manual_refresh_button.config(
-        command=lambda: refresh_file_list(manual_listbox, manual_refresh_button)
-    )
-    
     reset_button.config(
         command=lambda: stop_monitoring(lambda msg: status_label.config(text=msg), ui_elements)
     )
@@ -1326,10 +1998,6 @@ def create_gui():
         command=lambda: handle_submission(ui_elements, status_label)
     )
     
-    process_selected_button.config(
-        command=lambda: process_selected_file(manual_listbox, ui_elements, status_label)
-    )
-    
     pass_fail_button.config(
         command=lambda: handle_pass_fail(ui_elements, status_label, root)
     )
@@ -1343,61 +2011,215 @@ def create_gui():
     )
 
     # Event handlers
+    calendar_select_after_id = None
+
     def on_calendar_select(event):
+        # Arrow-keying through the list only auto-fills once the selection settles
+        nonlocal calendar_select_after_id
+        if calendar_select_after_id is not None:
+            cal_listbox.after_cancel(calendar_select_after_id)
+        calendar_select_after_id = cal_listbox.after(50, settle_calendar_select)
+
+    def settle_calendar_select():
+        nonlocal calendar_select_after_id
+        calendar_select_after_id = None
         auto_fill_from_selection(cal_listbox, ui_elements)
     
-    def on_manual_file_select(event):
-        if manual_listbox.curselection() and hasattr(manual_listbox, 'file_data') and manual_listbox.file_data:
-            process_selected_button.config(state=tk.NORMAL)
-        else:
-            process_selected_button.config(state=tk.DISABLED)
-    
     cal_listbox.bind('<<ListboxSelect>>', on_calendar_select)
-    manual_listbox.bind('<<ListboxSelect>>', on_manual_file_select)
+
+    # The Manual Files tab is only needed occasionally, so its widgets are built on first visit
+    manual_tab_built = False
+
+    def build_manual_tab():
+        tk.Label(manual_frame, text="Recent Audio/Video Files (Last 24 Hours):", font=FONT_BOLD_12).pack(pady=(10, 5))
+
+        # Create listbox with scrollbar for manual files
+        manual_listbox_frame = tk.Frame(manual_frame)
+        manual_listbox_frame.pack(pady=5, padx=10, fill=tk.BOTH, expand=True)
+
+        manual_scrollbar = tk.Scrollbar(manual_listbox_frame)
+        manual_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        manual_listbox = tk.Listbox(manual_listbox_frame, yscrollcommand=manual_scrollbar.set, height=15,
+                                    font=FONT_9, selectmode=tk.EXTENDED)
+        manual_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        manual_listbox.file_data = []
+        manual_scrollbar.config(command=manual_listbox.yview)
+
+        # Manual refresh button
+        manual_refresh_button = tk.Button(
+            manual_frame,
+            text="🔄 Refresh File List",
+            bg=COLOR_BLUE,
+            fg="white",
+            font=FONT_9
+        )
+        manual_refresh_button.pack(pady=5)
+
+        # Process selected button
+        process_selected_button = tk.Button(
+            manual_frame,
+            text="🎯 Process Selected Files",
+            state=tk.DISABLED,
+            bg=COLOR_ORANGE,
+            fg="white",
+            font=FONT_BOLD_10
+        )
+        process_selected_button.pack(pady=10)
+
+        manual_info_label = tk.Label(
+            manual_frame,
+            text="Use this tab if you forgot to start monitoring before uploading.\n"
+                 "Select one or more recent files (Ctrl/Shift-click) and click 'Process Selected Files'\n"
+                 "to transcribe and send them to your webhook. Make sure to fill in the meeting details\n"
+                 "in the Calendar Events tab first.",
+            fg="gray",
+            font=FONT_8,
+            wraplength=680
+        )
+        manual_info_label.pack(pady=10)
+
+        manual_refresh_button.config(
+            command=lambda: refresh_file_list(manual_listbox, manual_refresh_button)
+        )
+        process_selected_button.config(
+            command=lambda: process_selected_file(manual_listbox, ui_elements, status_label)
+        )
+        ui_elements['process_selected_button'] = process_selected_button
+
+        def on_manual_file_select(event):
+            # file_data is set when the listbox is created, so no hasattr check is needed
+            state = tk.NORMAL if manual_listbox.file_data and manual_listbox.curselection() else tk.DISABLED
+            process_selected_button.config(state=state)
+
+        manual_listbox.bind('<<ListboxSelect>>', on_manual_file_select)
+        refresh_file_list(manual_listbox, manual_refresh_button)
+
+    def on_tab_changed(event):
+        nonlocal manual_tab_built
+        if not manual_tab_built and notebook.select() == str(manual_frame):
+            manual_tab_built = True
+            build_manual_tab()
+
+    notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
 
     # Configuration update handlers
     timer_entry.bind("<FocusOut>", lambda e: update_wait_timer(timer_entry))
     timer_entry.bind("<KeyRelease>", lambda e: update_wait_timer(timer_entry))
     model_entry.bind("<FocusOut>", lambda e: update_whisper_model(model_entry))
     device_entry.bind("<FocusOut>", lambda e: update_whisper_device(device_entry))
+    compute_type_entry.bind("<FocusOut>", lambda e: update_whisper_compute_type(compute_type_entry))
+
+    # Initialize; the saved path is shown at once and checked off the Tk thread,
+    # since stat() on a network share can take a while
+    history_path = config.get("history_path")
+    if history_path:
+        file_label.config(text=f"Selected: {os.path.basename(history_path)}")
+
+        def reset_missing_history_label():
+            # The user may have picked another file while the check ran
+            if config.get("history_path") == history_path:
+                file_label.config(text="No ShareX history file selected")
 
-    # Initialize
-    if config.get("history_path") and os.path.exists(config["history_path"]):
-        file_label.config(text=f"Selected: {os.path.basename(config['history_path'])}")
+        def verify_history_path():
+            if not os.path.exists(history_path):
+                file_label.after(0, reset_missing_history_label)
+
+        threading.Thread(target=verify_history_path, daemon=True).start()
 
     update_submit_button_state(submit_button)
 
+    def update_env_banner():
+        if WEBHOOK_URL:
+            env_banner.pack_forget()
+        else:
+            env_banner.pack(fill=tk.X, before=notebook)
+
+    def on_reload_env():
+        reload_env()
+        update_env_banner()
+        update_submit_button_state(submit_button)
+        if WEBHOOK_URL:
+            resend_parked_webhook_sends()
+        logging.debug("[Config] Reloaded .env")
+
+    menubar = tk.Menu(root)
+    file_menu = tk.Menu(menubar, tearoff=0)
+    file_menu.add_command(label="Reload .env", command=on_reload_env)
+    menubar.add_cascade(label="File", menu=file_menu)
+    root.config(menu=menubar)
+    update_env_banner()
+
     # Auto-load calendar events on startup
-    root.after(1000, lambda: refresh_calendar_events(cal_listbox, cal_refresh_button, ui_elements))
+    root.after(1000, lambda: refresh_calendar_events(cal_listbox, cal_refresh_button, ui_elements, use_cache=True))
 
+    def destroy_when_manual_jobs_finish():
+        # Workers report through after(), which fails once the mainloop has ended,
+        # so the hidden window keeps the loop running until they are done
+        if manual_futures:
+            root.after(500, destroy_when_manual_jobs_finish)
+        else:
+            root.destroy()
+
+    def on_close():
+        if manual_futures:
+            answer = messagebox.askyesnocancel(
+                "Transcription Running",
+                "Files are still being transcribed.\n\n"
+                "Yes: close the window and let them finish and send in the background.\n"
+                "No: quit now and discard them."
+            )
+            if answer is None:
+                return
+            if answer is False:
+                if save_after_id is not None:
+                    save_config()
+                # Worker threads can't be cancelled, and interpreter exit would join them;
+                # os._exit skips atexit, so flush and close the log handlers first
+                logging.shutdown()
+                os._exit(0)
+            root.withdraw()
+        destroy_when_manual_jobs_finish()
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
     root.mainloop()
 
+    # The window closed before a debounced save fired
+    if save_after_id is not None:
+        save_config()
+    stop_webhook_sender()
+
 
 def refresh_file_list(listbox, refresh_button):
     """Refresh the list of recent audio/video files"""
     refresh_button.config(text="Refreshing...", state=tk.DISABLED)
     
-    # Clear current list
-    listbox.delete(0, tk.END)
-    
-    # Get recent files
-    recent_files = get_recent_audio_video_files()
-    
-    if recent_files:
-        for file_info in recent_files:
-            listbox.insert(tk.END, file_info['display_text'])
+    def show_files(recent_files):
+        """Fill the listbox; runs on the Tk thread"""
+        listbox.delete(0, tk.END)
         
-        # Store file info as listbox data
-        listbox.file_data = recent_files
-    else:
-        listbox.insert(tk.END, "No recent audio/video files found")
-        listbox.file_data = []
+        if recent_files:
+            # One insert call instead of a Tcl round-trip per file
+            listbox.insert(tk.END, *(file_info['display_text'] for file_info in recent_files))
+            
+            # Store file info as listbox data
+            listbox.file_data = recent_files
+        else:
+            listbox.insert(tk.END, "No recent audio/video files found")
+            listbox.file_data = []
+        
+        refresh_button.config(text="🔄 Refresh File List", state=tk.NORMAL)
+    
+    def scan_worker():
+        # Reading and parsing the history can stall the event loop, so it runs here
+        recent_files = get_recent_audio_video_files()
+        listbox.after(0, show_files, recent_files)
     
-    refresh_button.config(text="🔄 Refresh File List", state=tk.NORMAL)
+    threading.Thread(target=scan_worker, daemon=True).start()
 
 
 def process_selected_file(listbox, ui_elements, status_label):
-    """Process the selected file from the list"""
+    """Process the selected files from the list on the manual processing pool"""
     selection = listbox.curselection()
     if not selection:
         messagebox.showwarning("No Selection", "Please select a file from the list.")
@@ -1407,8 +2229,7 @@ def process_selected_file(listbox, ui_elements, status_label):
         messagebox.showerror("Error", "No file data available. Please refresh the list.")
         return
     
-    selected_index = selection[0]
-    if selected_index >= len(listbox.file_data):
+    if max(selection) >= len(listbox.file_data):
         messagebox.showerror("Error", "Invalid selection. Please refresh the list.")
         return
     
@@ -1420,78 +2241,112 @@ def process_selected_file(listbox, ui_elements, status_label):
         messagebox.showerror("Error", "Please enter both Notion URL and description in the Calendar Events tab.")
         return
     
-    webhook_url = os.getenv("WEBHOOK_URL", "").strip()
+    webhook_url = WEBHOOK_URL
     if not webhook_url:
         messagebox.showerror("Error", "Webhook URL not set in .env file.")
         return
     
     # Get selected file info
-    file_info = listbox.file_data[selected_index]
-    local_file_path = file_info['filepath']
+    selected_files = [listbox.file_data[index] for index in selection]
     
-    if not os.path.exists(local_file_path):
-        messagebox.showerror("Error", f"File not found: {local_file_path}")
-        return
+    for file_info in selected_files:
+        if not os.path.exists(file_info['filepath']):
+            messagebox.showerror("Error", f"File not found: {file_info['filepath']}")
+            return
     
     # Update config with current UI values
-    config["whisper_model"] = ui_elements['model_entry'].get().strip()
-    config["whisper_device"] = ui_elements['device_entry'].get().strip()
-    save_config()
+    update_config(
+        status_label,
+        **whisper_settings_from_ui(ui_elements),
+    )
     
     # Disable manual processing button during processing
     ui_elements['process_selected_button'].config(state=tk.DISABLED)
     
     def status_update(message):
-        status_label.config(text=message)
+        status_label.after(0, lambda m=message: status_label.config(text=m))
+    
+    remaining_files = len(selected_files)
     
-    def processing_complete():
-        ui_elements['process_selected_button'].config(state=tk.NORMAL)
+    def file_finished():
+        # Runs on the Tk thread, so the counter needs no lock
+        nonlocal remaining_files
+        remaining_files -= 1
+        if remaining_files == 0:
+            ui_elements['process_selected_button'].config(state=tk.NORMAL)
     
-    # Process the file in a separate thread
-    def process_thread():
+    def process_one(file_info):
+        status_update(f"🎬 Processing: {file_info['filename']}")
+        # Process the file (extract audio then transcribe)
+        return process_audio_file(file_info['filepath'], status_update)
+    
+    def on_file_processed(future, file_info):
         try:
-            status_update(f"🎬 Processing: {file_info['filename']}")
-            
-            # Process the file (extract audio then transcribe)
-            transcription = process_audio_file(local_file_path, status_update)
-            
+            transcription = future.result()
             if transcription:
-                # Send to webhook
-                send_to_webhook(notion_url, description, transcription, file_info['url'], local_file_path)
-                status_update("✅ File processed and sent to webhook!")
+                # Delivered (and retried) by the background sender; queued before any
+                # Tk call so the transcript is kept even if the window is going away
+                queue_webhook_send({
+                    "notion_url": notion_url,
+                    "description": description,
+                    "transcription": transcription,
+                    "drive_url": file_info['url'],
+                    "local_file_path": file_info['filepath'],
+                }, status_update)
+                status_update(f"📤 {file_info['filename']} processed, sending to webhook...")
             else:
-                status_update("❌ File processing failed")
-                
+                status_update(f"❌ File processing failed: {file_info['filename']}")
         except Exception as e:
             logging.error(f"[Manual Process] Error processing selected file: {e}")
             status_update(f"❌ Error: {str(e)}")
         finally:
-            processing_complete()
+            status_label.after(0, file_finished)
     
-    # Start processing in background thread
-    thread = threading.Thread(target=process_thread, daemon=True)
-    thread.start()
+    # Files extract in parallel on the shared pool; transcription itself takes turns
+    for file_info in selected_files:
+        future = manual_executor.submit(process_one, file_info)
+        manual_futures.add(future)
+        future.add_done_callback(functools.partial(on_file_processed, file_info=file_info))
+        future.add_done_callback(manual_futures.discard)
 
 
 def update_wait_timer(entry):
     try:
         minutes = int(entry.get().strip())
         if minutes > 0:
-            config["wait_timer_minutes"] = minutes
-            save_config()
+            update_config(entry, wait_timer_minutes=minutes)
     except ValueError:
         pass
 
 
+def whisper_settings_from_ui(ui_elements):
+    """Whisper settings from the form; a cleared model field keeps the current model"""
+    settings = {
+        "whisper_device": ui_elements['device_entry'].get().strip() or "auto",
+        "whisper_compute_type": ui_elements['compute_type_entry'].get().strip() or "auto",
+    }
+    model = ui_elements['model_entry'].get().strip()
+    if model:
+        settings["whisper_model"] = model
+    return settings
+
+
 def update_whisper_model(entry):
-    config["whisper_model"] = entry.get().strip()
-    save_config()
+    # A cleared field keeps the current model rather than saving an unusable one
+    model = entry.get().strip()
+    if model and update_config(entry, whisper_model=model):
+        preload_whisper_model()
 
 
 def update_whisper_device(entry):
-    config["whisper_device"] = entry.get().strip()
-    save_config()
+    if update_config(entry, whisper_device=entry.get().strip() or "auto"):
+        preload_whisper_model()
+
+
+def update_whisper_compute_type(entry):
+    if update_config(entry, whisper_compute_type=entry.get().strip() or "auto"):
+        preload_whisper_model()
 
 
 if __name__ == "__main__":
-    create_gui()
\ No newline at end of file
+    create_gui()
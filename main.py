@@ -1,14 +1,15 @@
 """Main entry point for the application."""
 
 import sys
+import logging
 from PyQt6.QtWidgets import QApplication
 from core.logging_config import setup_logging
 from gui.main_window import MainApplication
 
 def main():
     """Initialize and run the application."""
-    # Set up logging
-    setup_logging()
+    # Set up logging (pass --debug for verbose output)
+    setup_logging(level=logging.DEBUG if "--debug" in sys.argv else logging.INFO)
     
     # Create QApplication FIRST (required by PyQt)
     app = QApplication(sys.argv)
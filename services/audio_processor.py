@@ -4,85 +4,270 @@ import os
 import tempfile
 import subprocess
 import logging
-from typing import Optional
-from transcribe_anything import transcribe_anything
+import functools
+import threading
+from typing import Optional, Callable, List, Tuple, Union, Any
+from core.constants import AUTO_COMPUTE_TYPES, WHISPER_CPP_MODEL_URL, WHISPER_CPP_CACHE_DIR, WHISPER_CPP_QUANTS
+
+# Guards model loading so the startup preload and a submission never load twice
+_model_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """Probe once whether CTranslate2 can see a CUDA device."""
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception as e:
+        logging.debug(f"[Whisper] CUDA probe failed, using CPU: {e}")
+        return False
+
+@functools.lru_cache(maxsize=2)
+def _get_model(name: str, device: str, compute_type: str):
+    """Load a Whisper model once and keep it warm for later transcriptions."""
+    # Imported lazily: faster-whisper pulls in ctranslate2 and is slow to import
+    from faster_whisper import WhisperModel
+    
+    logging.debug(f"[Whisper] Loading model '{name}' on {device} ({compute_type})")
+    return WhisperModel(name, device=device, compute_type=compute_type)
+
+@functools.lru_cache(maxsize=2)
+def _get_batched_pipeline(name: str, device: str, compute_type: str):
+    """Wrap the cached model in a batched pipeline, reused across transcriptions."""
+    from faster_whisper import BatchedInferencePipeline
+    
+    return BatchedInferencePipeline(model=_get_model(name, device, compute_type))
 
 class AudioProcessor:
+    # Number of transcribed segments handed to segment_callback at a time
+    PARTIAL_SEGMENT_BATCH = 20
+    
     def __init__(self, config_manager):
         self.config = config_manager
+        self._preload_failed_key = None
+    
+    def resolve_device(self) -> str:
+        """Return the configured device, picking cuda or cpu when set to auto."""
+        device = (self.config.get("whisper_device", "auto") or "auto").strip()
+        if device == "auto":
+            return "cuda" if _cuda_available() else "cpu"
+        return device
+    
+    def _model_key(self):
+        """Return the (model, device, compute_type) key for the current config."""
+        device = self.resolve_device()
+        compute_type = self.config.get("whisper_compute_type", "auto")
+        if compute_type == "auto":
+            # Quantized weights: int8 on CPU, int8 weights with fp16 activations on GPU
+            compute_type = AUTO_COMPUTE_TYPES["cuda" if device.startswith("cuda") else "cpu"]
+        return (
+            self.config.get("whisper_model", "base"),
+            device,
+            compute_type,
+        )
+    
+    def get_model(self):
+        """Get the cached Whisper model for the current configuration."""
+        with _model_lock:
+            return _get_model(*self._model_key())
+    
+    def preload_model(self) -> None:
+        """Load the Whisper model in the background so the first submission is fast."""
+        if self.config.get("whisper_backend", "faster_whisper") != "faster_whisper":
+            return
+        
+        def preload_worker():
+            # Resolved here: probing for CUDA imports ctranslate2, which is slow
+            model_key = self._model_key()
+            if model_key == self._preload_failed_key:
+                # Don't keep retrying a broken setup in the background
+                return
+            try:
+                self.get_model()
+                logging.debug("[Whisper] Model preloaded")
+            except Exception as e:
+                self._preload_failed_key = model_key
+                logging.warning(f"[Whisper] Failed to preload model: {e}")
+        
+        threading.Thread(target=preload_worker, daemon=True).start()
+    
+    @staticmethod
+    def clear_model_cache() -> None:
+        """Drop cached models, e.g. after the model or device setting changes."""
+        with _model_lock:
+            _get_batched_pipeline.cache_clear()
+            _get_model.cache_clear()
+        logging.debug("[Whisper] Model cache cleared")
     
     def extract_audio(self, file_path: str, status_callback) -> Optional[str]:
         """Extract audio from video/audio file and return path to extracted audio."""
         status_callback("🎧 Extracting audio from file...")
         logging.debug(f"[Audio] Starting audio extraction from: {file_path}")
         
-        temp_audio_path = tempfile.mktemp(suffix=".wav")
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_audio:
+            temp_audio_path = temp_audio.name
         try:
             subprocess.run(
-                ["ffmpeg", "-y", "-i", file_path, "-vn", "-acodec", "pcm_s16le", 
-                 "-ar", "16000", "-ac", "1", temp_audio_path],
+                ["ffmpeg", "-y", "-nostdin", "-loglevel", "error", "-i", file_path, "-vn",
+                 "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1", temp_audio_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True
+            )
+            
+            # The temp file was created up front, so a zero exit means it holds the audio
+            logging.debug(f"[Audio] Audio extracted successfully to: {temp_audio_path}")
+            status_callback("✅ Audio extraction completed!")
+            return temp_audio_path
+                
+        except subprocess.CalledProcessError as e:
+            logging.error(f"[Audio] Error extracting audio: {e.stderr.decode(errors='replace')}")
+            status_callback(f"❌ Audio extraction failed: {e.stderr.decode(errors='replace')}")
+            self._remove_temp_file(temp_audio_path)
+            return None
+        except Exception as e:
+            logging.error(f"[Audio] Unexpected error during audio extraction: {e}")
+            status_callback(f"❌ Audio extraction failed: {str(e)}")
+            self._remove_temp_file(temp_audio_path)
+            return None
+    
+    def decode_audio(self, file_path: str, status_callback) -> Optional[Any]:
+        """Decode a file in-process to 16 kHz mono float32 samples via PyAV.
+        
+        Returns None if the container can't be decoded, so callers can fall
+        back to the ffmpeg extraction path.
+        """
+        status_callback("🎧 Decoding audio...")
+        try:
+            # faster-whisper ships a PyAV-based decoder that resamples for us
+            from faster_whisper.audio import decode_audio
+            
+            audio = decode_audio(file_path, sampling_rate=16000)
+            logging.debug(f"[Audio] Decoded {len(audio) / 16000:.1f}s of audio in-process")
+            return audio
+        except Exception as e:
+            logging.warning(f"[Audio] In-process decode failed, falling back to ffmpeg: {e}")
+            return None
+    
+    def extract_pcm(self, file_path: str, status_callback) -> Optional[Any]:
+        """Extract audio with ffmpeg piped straight into memory as float32 samples."""
+        status_callback("🎧 Extracting audio from file...")
+        logging.debug(f"[Audio] Piping audio from ffmpeg for: {file_path}")
+        
+        try:
+            import numpy as np
+            
+            result = subprocess.run(
+                ["ffmpeg", "-nostdin", "-loglevel", "error",
+                 "-threads", str(min(4, os.cpu_count() or 1)),
+                 "-i", file_path, "-vn", "-f", "s16le", "-acodec", "pcm_s16le",
+                 "-ar", "16000", "-ac", "1", "-"],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 check=True
             )
+            # Scale in place: a 1 h recording is ~230 MB as float32, so skip the extra copy
+            audio = np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32)
+            audio *= 1.0 / 32768.0
             
-            if os.path.exists(temp_audio_path):
-                logging.debug(f"[Audio] Audio extracted successfully to: {temp_audio_path}")
+            if audio.size:
                 status_callback("✅ Audio extraction completed!")
-                return temp_audio_path
+                return audio
             else:
-                logging.error("[Audio] Audio file not created")
-                status_callback("❌ Audio extraction failed - no output file")
+                logging.error("[Audio] ffmpeg produced no audio samples")
+                status_callback("❌ Audio extraction failed - no audio stream")
                 return None
                 
         except subprocess.CalledProcessError as e:
-            logging.error(f"[Audio] Error extracting audio: {e.stderr.decode()}")
-            status_callback(f"❌ Audio extraction failed: {e.stderr.decode()}")
+            logging.error(f"[Audio] Error extracting audio: {e.stderr.decode(errors='replace')}")
+            status_callback(f"❌ Audio extraction failed: {e.stderr.decode(errors='replace')}")
             return None
         except Exception as e:
             logging.error(f"[Audio] Unexpected error during audio extraction: {e}")
             status_callback(f"❌ Audio extraction failed: {str(e)}")
             return None
     
-    def transcribe_locally(self, audio_file_path: str, status_callback) -> Optional[str]:
-        """Transcribe audio file using local Whisper model."""
+    def transcribe_locally(self, audio: Union[str, Any], status_callback,
+                           segment_callback: Optional[Callable[[List[Tuple[float, float, str]]], None]] = None
+                           ) -> Optional[str]:
+        """Transcribe an audio file path or decoded sample array using local Whisper model.
+        
+        If segment_callback is given it receives batches of (start, end, text)
+        tuples as segments are decoded, before the full text is returned.
+        """
         try:
             status_callback("🎯 Starting local transcription...")
-            logging.debug(f"[Whisper] Starting transcription of: {audio_file_path}")
             
-            if not os.path.exists(audio_file_path):
-                status_callback("❌ Audio file not found")
-                return None
-                
-            file_size = os.path.getsize(audio_file_path)
-            logging.debug(f"[Whisper] Audio file size: {file_size} bytes")
-
-            output_dir = tempfile.mkdtemp()
-            logging.debug(f"[Whisper] Using temporary directory: {output_dir}")
+            if isinstance(audio, str):
+                logging.debug(f"[Whisper] Starting transcription of: {audio}")
+                try:
+                    file_size = os.path.getsize(audio)
+                except FileNotFoundError:
+                    status_callback("❌ Audio file not found")
+                    return None
+                logging.debug(f"[Whisper] Audio file size: {file_size} bytes")
+            
+            if self.config.get("whisper_backend", "faster_whisper") == "whisper_cpp":
+                return self._transcribe_whisper_cpp(audio, status_callback)
 
             try:
-                transcribe_anything(
-                    url_or_file=audio_file_path,
-                    output_dir=output_dir,
-                    task="transcribe",
-                    model=self.config.get("whisper_model", "base"),
-                    device=self.config.get("whisper_device", "cpu"),
-                    language=None
-                )
+                model = self.get_model()
+                device = self.resolve_device()
+                batch_size = int(self.config.get("whisper_batch_size", 16))
+                beam_size = int(self.config.get("whisper_beam_size", 1))
                 
-                base_name = "out"
-                output_txt = os.path.join(output_dir, f"{base_name}.txt")
+                batched = self.config.get("whisper_batched_inference", "auto")
+                if batched == "auto":
+                    # Batching pays off on GPU; CPU runs usually do better unbatched
+                    batched = device.startswith("cuda")
                 
-                if os.path.exists(output_txt):
-                    with open(output_txt, "r", encoding="utf-8") as f:
-                        transcription_text = f.read()
-                    
+                if batched and batch_size > 1:
+                    # VAD-split speech chunks of the file decoded in batches
+                    logging.debug(f"[Whisper] Using batched inference (batch_size={batch_size})")
+                    with _model_lock:
+                        pipeline = _get_batched_pipeline(*self._model_key())
+                    segments, info = pipeline.transcribe(
+                        audio,
+                        task="transcribe",
+                        language=None,
+                        beam_size=beam_size,
+                        batch_size=batch_size,
+                        vad_filter=True
+                    )
+                else:
+                    # Greedy decoding and skipping silence keep CPU runs fast
+                    segments, info = model.transcribe(
+                        audio,
+                        task="transcribe",
+                        language=None,
+                        beam_size=beam_size,
+                        vad_filter=True
+                    )
+                logging.debug(f"[Whisper] Detected language: {info.language}")
+                
+                lines = []
+                pending = []
+                for segment in segments:
+                    text = segment.text.strip()
+                    lines.append(text)
+                    if segment_callback:
+                        pending.append((segment.start, segment.end, text))
+                        if len(pending) >= self.PARTIAL_SEGMENT_BATCH:
+                            status_callback(f"📝 Transcribed {len(lines)} segments...")
+                            segment_callback(pending)
+                            pending = []
+                if segment_callback and pending:
+                    segment_callback(pending)
+                
+                transcription_text = "\n".join(lines)
+                
+                if transcription_text:
                     status_callback("✅ Transcription completed!")
                     logging.debug(f"[Whisper] Transcription completed successfully")
                     return transcription_text
                 else:
-                    status_callback("❌ Transcription output not found")
-                    logging.error("[Whisper] No output text file found")
+                    status_callback("❌ Transcription output is empty")
+                    logging.error("[Whisper] No speech transcribed")
                     return None
                     
             except Exception as e:
@@ -95,26 +280,134 @@ class AudioProcessor:
             status_callback(f"❌ Local transcription failed: {str(e)}")
             return None
     
-    def process_file(self, file_path: str, status_callback) -> Optional[str]:
-        """Process audio/video file: extract audio first, then transcribe."""
+    def _get_whisper_cpp_model(self, status_callback) -> str:
+        """Return the local path of the quantized GGML model, downloading it on first use."""
+        model = self.config.get("whisper_model", "base")
+        quant = self._resolve_whisper_cpp_quant(model, self.config.get("whisper_quant", "q5_1"))
+        filename = f"ggml-{model}.bin" if quant == "f16" else f"ggml-{model}-{quant}.bin"
+        model_path = os.path.join(WHISPER_CPP_CACHE_DIR, filename)
+        if os.path.exists(model_path):
+            return model_path
+        
+        import requests
+        
+        url = WHISPER_CPP_MODEL_URL.format(filename=filename)
+        status_callback(f"⬇️ Downloading {filename}...")
+        logging.info(f"[Whisper.cpp] Downloading model from {url}")
+        os.makedirs(WHISPER_CPP_CACHE_DIR, exist_ok=True)
+        
+        partial_path = model_path + ".part"
+        try:
+            with requests.get(url, stream=True, timeout=(5, 60)) as response:
+                response.raise_for_status()
+                with open(partial_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        f.write(chunk)
+            os.replace(partial_path, model_path)
+        except BaseException:
+            self._remove_temp_file(partial_path)
+            raise
+        return model_path
+    
+    @staticmethod
+    def _resolve_whisper_cpp_quant(model: str, quant: str) -> str:
+        """Return a quant that is published for model, or raise ValueError."""
+        base_model = model[:-len(".en")] if model.endswith(".en") else model
+        available = WHISPER_CPP_QUANTS.get(base_model)
+        if available is None:
+            raise ValueError(
+                f"No whisper.cpp weights for model '{model}'. "
+                f"Use one of: {', '.join(WHISPER_CPP_QUANTS)}"
+            )
+        if quant in available:
+            return quant
+        # q5_1 and q5_0 are the same size class; each model only ships one of them
+        swapped = {"q5_1": "q5_0", "q5_0": "q5_1"}.get(quant)
+        if swapped in available:
+            logging.debug(f"[Whisper.cpp] {model} has no {quant} weights, using {swapped}")
+            return swapped
+        raise ValueError(
+            f"whisper.cpp model '{model}' has no {quant} weights. "
+            f"Available: {', '.join(available)}"
+        )
+    
+    def _transcribe_whisper_cpp(self, audio_file_path: str, status_callback) -> Optional[str]:
+        """Transcribe with the whisper.cpp CLI using quantized GGML weights."""
+        try:
+            model_path = self._get_whisper_cpp_model(status_callback)
+            binary = self.config.get("whisper_cpp_binary", "whisper-cli")
+            
+            with tempfile.TemporaryDirectory(prefix="whisper_") as output_dir:
+                output_prefix = os.path.join(output_dir, "out")
+                subprocess.run(
+                    [binary, "-m", model_path, "-t", str(os.cpu_count() or 4),
+                     "-f", audio_file_path, "-otxt", "-of", output_prefix],
+                    # The transcript is read from the -otxt file, not stdout
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    check=True
+                )
+                
+                with open(output_prefix + ".txt", "rb") as f:
+                    transcription_text = f.read().decode("utf-8").strip()
+            
+            if transcription_text:
+                status_callback("✅ Transcription completed!")
+                logging.debug("[Whisper.cpp] Transcription completed successfully")
+                return transcription_text
+            else:
+                status_callback("❌ Transcription output is empty")
+                logging.error("[Whisper.cpp] No speech transcribed")
+                return None
+                
+        except subprocess.CalledProcessError as e:
+            logging.error(f"[Whisper.cpp] Transcription failed: {e.stderr.decode(errors='replace')}")
+            status_callback("❌ Local transcription failed: whisper.cpp exited with an error")
+            return None
+        except Exception as e:
+            logging.error(f"[Whisper.cpp] Transcription failed: {e}")
+            status_callback(f"❌ Local transcription failed: {str(e)}")
+            return None
+    
+    def process_file(self, file_path: str, status_callback,
+                     segment_callback: Optional[Callable[[List[Tuple[float, float, str]]], None]] = None
+                     ) -> Optional[str]:
+        """Process audio/video file: decode or extract audio first, then transcribe."""
+        audio_path = None
         try:
+            if self.config.get("whisper_backend", "faster_whisper") == "faster_whisper":
+                # Decoding in-process skips the ffmpeg fork and the temp WAV round-trip;
+                # ffmpeg still pipes PCM straight to memory for anything PyAV can't demux
+                audio = self.decode_audio(file_path, status_callback)
+                if audio is None:
+                    audio = self.extract_pcm(file_path, status_callback)
+                if audio is None:
+                    status_callback("❌ Failed to extract audio")
+                    return None
+                return self.transcribe_locally(audio, status_callback, segment_callback)
+            
+            # whisper.cpp reads a WAV file from disk
             audio_path = self.extract_audio(file_path, status_callback)
-            if not audio_path or not os.path.exists(audio_path):
+            if not audio_path:
                 status_callback("❌ Failed to extract audio")
                 return None
 
-            transcription = self.transcribe_locally(audio_path, status_callback)
-            
-            try:
-                if os.path.exists(audio_path):
-                    os.remove(audio_path)
-                    logging.debug(f"[Cleanup] Removed temporary audio file: {audio_path}")
-            except Exception as e:
-                logging.warning(f"[Cleanup] Failed to remove temporary file: {e}")
-
-            return transcription
+            return self.transcribe_locally(audio_path, status_callback, segment_callback)
             
         except Exception as e:
             logging.error(f"[Process] Error processing audio file: {e}")
             status_callback(f"❌ Error processing file: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+        finally:
+            if audio_path:
+                self._remove_temp_file(audio_path)
+    
+    def _remove_temp_file(self, path: str) -> None:
+        """Delete a temporary audio file, logging rather than raising on failure."""
+        try:
+            os.remove(path)
+            logging.debug(f"[Cleanup] Removed temporary audio file: {path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"[Cleanup] Failed to remove temporary file: {e}")
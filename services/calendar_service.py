@@ -1,17 +1,48 @@
 """Calendar integration service."""
 
 import os
+import json
+import time
+import itertools
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
 from typing import List, Dict, Any
 from dotenv import load_dotenv
 
+from core.constants import EVENTS_CACHE_FILE
+from utils.helpers import parse_iso_datetime
+
 load_dotenv()
 
 class CalendarService:
+    # (connect, read) timeouts in seconds
+    TIMEOUT = (3.05, 10)
+    # Oldest on-disk events shown at startup before the first fetch completes
+    DISK_CACHE_MAX_AGE_SECONDS = 15 * 60
+    # Events that started longer ago than this are dropped before formatting
+    PAST_EVENT_HORIZON_SECONDS = 24 * 60 * 60
+    # Capitalized summary words that are never part of a participant name
+    NAME_STOPWORDS = frozenset({'Initial', 'Interview', 'Meeting', 'With'})
+    
     def __init__(self):
         self.webhook_url = os.getenv("WEBHOOK_URL2", "").strip()
+        self.session = self._create_session()
+    
+    def _create_session(self) -> requests.Session:
+        """Create a keep-alive session so repeated refreshes skip the TLS handshake."""
+        retry = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504]
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
     
     def fetch_events(self) -> List[Dict[str, Any]]:
         """Fetch calendar events from the webhook."""
@@ -21,7 +52,7 @@ class CalendarService:
                 return []
             
             logging.debug(f"[Calendar] Fetching events from: {self.webhook_url}")
-            response = requests.get(self.webhook_url, timeout=10)
+            response = self.session.get(self.webhook_url, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             events = response.json()
@@ -29,6 +60,7 @@ class CalendarService:
                 logging.error("[Calendar] Response is not a list")
                 return []
             
+            self._save_disk_cache(events)
             return self._process_events(events)
             
         except requests.RequestException as e:
@@ -38,6 +70,31 @@ class CalendarService:
             logging.error(f"[Calendar] Error fetching calendar events: {e}")
             return []
     
+    def load_cached_events(self) -> List[Dict[str, Any]]:
+        """Return events from the last fetch saved on disk, or [] if missing or stale."""
+        try:
+            with open(EVENTS_CACHE_FILE, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if time.time() - cached["ts"] > self.DISK_CACHE_MAX_AGE_SECONDS:
+                return []
+            return self._process_events(cached["events"])
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logging.warning(f"[Calendar] Ignoring unreadable events cache: {e}")
+            return []
+    
+    def _save_disk_cache(self, events: List[Dict]) -> None:
+        """Save the raw webhook response so the next start can show it immediately."""
+        try:
+            os.makedirs(os.path.dirname(EVENTS_CACHE_FILE), exist_ok=True)
+            temp_path = EVENTS_CACHE_FILE + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"ts": time.time(), "events": events}, f)
+            os.replace(temp_path, EVENTS_CACHE_FILE)
+        except Exception as e:
+            logging.warning(f"[Calendar] Could not save events cache: {e}")
+    
     def _process_events(self, events: List[Dict]) -> List[Dict[str, Any]]:
         """Process raw calendar events."""
         processed_events = []
@@ -46,15 +103,18 @@ class CalendarService:
         for event in events:
             try:
                 start_time_str = event['start']['dateTime']
-                start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
+                start_time = parse_iso_datetime(start_time_str)
+                seconds_until = (start_time - now).total_seconds()
+                if seconds_until < -self.PAST_EVENT_HORIZON_SECONDS:
+                    continue
+                
                 local_start = start_time.astimezone()
                 
                 summary = event.get('summary', '')
                 participant_name = self._extract_participant_name(summary)
                 display_time = local_start.strftime("%I:%M %p")
                 
-                time_diff = start_time - now
-                is_upcoming = 0 <= time_diff.total_seconds() <= 1800
+                is_upcoming = 0 <= seconds_until <= 1800
                 
                 location = event.get('location', '').strip()
                 
@@ -72,7 +132,7 @@ class CalendarService:
                             else f"https://{location}"
                         ) if location else "",
                     'is_upcoming': is_upcoming,
-                    'time_until': time_diff.total_seconds() if time_diff.total_seconds() > 0 else 0,
+                    'time_until': seconds_until if seconds_until > 0 else 0,
                     'display_text': f"{local_start.strftime('%Y-%m-%d %I:%M %p')} - {summary}",
                     'auto_description': f"{display_time} {participant_name}".strip()
                 }
@@ -104,14 +164,15 @@ class CalendarService:
                 if paren_content and len(paren_content.split()) <= 3:
                     return paren_content
             
-            words = summary.split()
-            potential_names = []
-            for word in words:
-                if word.istitle() and len(word) > 2 and word not in ['Initial', 'Interview', 'Meeting', 'With']:
-                    potential_names.append(word)
+            # Only the first two candidates are used, so stop scanning once found
+            potential_names = list(itertools.islice(
+                (word for word in summary.split()
+                 if word.istitle() and len(word) > 2 and word not in self.NAME_STOPWORDS),
+                2
+            ))
             
             if potential_names:
-                return " ".join(potential_names[:2])
+                return " ".join(potential_names)
                 
             return "Meeting"
             
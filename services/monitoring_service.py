@@ -2,13 +2,45 @@
 
 import os
 import time
-import json
 import logging
 import threading
-from datetime import datetime, timezone
-from typing import Callable, Optional
+from datetime import datetime
+from typing import Callable, Optional, List, Dict, Any
+
+from core.constants import VALID_AUDIO_VIDEO_EXTENSIONS
+from services.sharex_service import parse_history_entries
+from utils.helpers import parse_iso_datetime
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+class _HistoryChangeHandler(FileSystemEventHandler):
+    """Wakes the monitoring worker when the ShareX history file changes."""
+    
+    def __init__(self, history_path: str, changed_event: threading.Event):
+        super().__init__()
+        self.history_path = os.path.normcase(os.path.abspath(history_path))
+        self.changed_event = changed_event
+    
+    def on_any_event(self, event):
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path and os.path.normcase(os.path.abspath(path)) == self.history_path:
+                self.changed_event.set()
+                return
 
 class MonitoringService:
+    # Without watchdog the history file is polled, starting at POLL_MIN_SECONDS and
+    # backing off towards the poll_interval_seconds setting while nothing changes
+    POLL_MIN_SECONDS = 0.25
+    POLL_BACKOFF = 1.5
+    # With watchdog, still re-check occasionally in case an event is missed
+    WATCH_FALLBACK_SECONDS = 5
+    
     def __init__(self, config_manager, audio_processor, webhook_service):
         self.config = config_manager
         self.audio_processor = audio_processor
@@ -16,6 +48,17 @@ class MonitoringService:
         self.monitoring_active = False
         self.monitoring_thread = None
         self.start_time = None
+        self.deadline = None
+        self._history_changed = threading.Event()
+        # Current history read error, kept so the countdown can keep showing it
+        self.last_error_text = None
+        self._reset_history_cursor()
+    
+    def _reset_history_cursor(self):
+        """Forget how much of the history file has been read."""
+        self._history_offset = 0
+        self._history_size = None
+        self._history_mtime = None
     
     def start_monitoring(self, after_dt: datetime, timeout_minutes: int,
                         notion_url: str, description: str,
@@ -24,45 +67,44 @@ class MonitoringService:
         """Start monitoring for new audio/video uploads."""
         self.monitoring_active = True
         self.start_time = datetime.now()
-        timeout_seconds = timeout_minutes * 60
+        self.deadline = time.monotonic() + timeout_minutes * 60
+        self._reset_history_cursor()
+        self._history_changed.clear()
+        self.last_error_text = None
         
         logging.debug(f"[Monitor] Starting monitoring with {timeout_minutes} minute timeout")
         logging.debug(f"[Monitor] Watching for uploads after {after_dt.isoformat()}")
 
         def monitoring_worker():
-            start_monitor_time = time.time()
-            last_display_time = 0
-            
-            while self.monitoring_active:
-                current_time = time.time()
-                elapsed_seconds = current_time - start_monitor_time
-                
-                if elapsed_seconds >= timeout_seconds:
-                    self.monitoring_active = False
-                    status_callback("⏰ Time limit reached - monitoring stopped")
-                    completion_callback()
-                    logging.debug("[Monitor] Timeout reached, stopping monitoring")
-                    return
-                
-                remaining_seconds = int(timeout_seconds - elapsed_seconds)
-                
-                if int(current_time) != last_display_time:
-                    last_display_time = int(current_time)
+            observer = self._start_history_observer()
+            poll_max = max(self.POLL_MIN_SECONDS, float(self.config.get("poll_interval_seconds", 5)))
+            wait_seconds = self.WATCH_FALLBACK_SECONDS if observer else self.POLL_MIN_SECONDS
+            try:
+                while self.monitoring_active:
+                    if time.monotonic() >= self.deadline:
+                        self.monitoring_active = False
+                        status_callback("⏰ Time limit reached - monitoring stopped")
+                        completion_callback()
+                        logging.debug("[Monitor] Timeout reached, stopping monitoring")
+                        return
                     
-                    hours = remaining_seconds // 3600
-                    minutes = (remaining_seconds % 3600) // 60
-                    seconds = remaining_seconds % 60
+                    cursor = (self._history_size, self._history_mtime)
+                    self._check_for_new_files(after_dt, notion_url, description, 
+                                             callback, status_callback, completion_callback)
                     
-                    if hours > 0:
-                        time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                    else:
-                        time_str = f"{minutes:02d}:{seconds:02d}"
+                    if not observer:
+                        if (self._history_size, self._history_mtime) != cursor:
+                            wait_seconds = self.POLL_MIN_SECONDS
+                        else:
+                            wait_seconds = min(wait_seconds * self.POLL_BACKOFF, poll_max)
                     
-                    status_callback(f"👀 Monitoring for uploads... {time_str} remaining")
-                
-                self._check_for_new_files(after_dt, notion_url, description, 
-                                         callback, status_callback, completion_callback)
-                time.sleep(1)
+                    # Sleep until the history file changes, monitoring stops or the time limit hits
+                    self._history_changed.wait(min(wait_seconds, max(0, self.deadline - time.monotonic())))
+                    self._history_changed.clear()
+            finally:
+                if observer:
+                    observer.stop()
+                    observer.join()
             
             if not self.monitoring_active:
                 completion_callback()
@@ -70,63 +112,124 @@ class MonitoringService:
         self.monitoring_thread = threading.Thread(target=monitoring_worker, daemon=True)
         self.monitoring_thread.start()
     
+    def _start_history_observer(self):
+        """Watch the history file for changes, or return None to fall back to polling."""
+        history_path = self.config.get("history_path")
+        if not WATCHDOG_AVAILABLE or not history_path:
+            return None
+        
+        try:
+            handler = _HistoryChangeHandler(history_path, self._history_changed)
+            observer = Observer()
+            observer.schedule(handler, os.path.dirname(os.path.abspath(history_path)), recursive=False)
+            observer.start()
+            logging.debug("[Monitor] Watching history file for changes")
+            return observer
+        except Exception as e:
+            logging.warning(f"[Monitor] Could not watch history file, polling instead: {e}")
+            return None
+    
+    def remaining_seconds(self) -> int:
+        """Seconds left before the monitoring time limit is reached."""
+        if self.deadline is None:
+            return 0
+        return max(0, int(self.deadline - time.monotonic()))
+    
     def _check_for_new_files(self, after_dt, notion_url, description,
                             callback, status_callback, completion_callback):
         """Check ShareX history for new files."""
         history_path = self.config.get("history_path")
-        if not history_path or not os.path.exists(history_path):
+        if not history_path:
             return
         
         try:
-            with open(history_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            raw_entries = "[" + content.replace("}\n{", "},\n{") + "]"
-            history = json.loads(raw_entries)
+            try:
+                new_entries = self._read_new_history_entries(history_path)
+            except FileNotFoundError:
+                # ShareX hasn't created the history yet
+                return
+            self.last_error_text = None
+            if not new_entries:
+                return
             
-            from core.constants import VALID_AUDIO_VIDEO_EXTENSIONS
-
-            for entry in reversed(history):
+            for entry in reversed(new_entries):
                 if not self.monitoring_active:
                     return
                     
                 if "FilePath" in entry and "DateTime" in entry:
-                    entry_time = datetime.fromisoformat(entry["DateTime"].replace("Z", "+00:00"))
-                    if entry_time.tzinfo is None:
-                        entry_time = entry_time.replace(tzinfo=timezone.utc)
+                    entry_time = parse_iso_datetime(entry["DateTime"])
+                    
+                    # ShareX appends chronologically, so everything older is stale
+                    if entry_time <= after_dt:
+                        return
+                    
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug(f"[Monitor] New file found: {entry.get('FileName')}")
+                    file_name = entry.get("FileName", "").lower()
                     
-                    if entry_time > after_dt:
-                        logging.debug(f"[Monitor] New file found: {entry['FileName']}")
-                        file_name = entry.get("FileName", "").lower()
+                    if file_name.endswith(VALID_AUDIO_VIDEO_EXTENSIONS):
+                        self.monitoring_active = False
+                        status_callback("🎬 Found audio/video file!")
                         
-                        if any(file_name.endswith(ext) for ext in VALID_AUDIO_VIDEO_EXTENSIONS):
-                            self.monitoring_active = False
-                            status_callback("🎬 Found audio/video file!")
-                            
-                            local_file_path = entry["FilePath"]
-                            if os.path.exists(local_file_path):
-                                transcription = self.audio_processor.process_file(local_file_path, status_callback)
-                                if transcription:
-                                    drive_url = entry.get("URL", "")
-                                    self.webhook_service.send_data(
-                                        notion_url, description, transcription, 
-                                        drive_url, local_file_path
-                                    )
-                                    callback(transcription, drive_url, local_file_path)
-                                    completion_callback()
-                                else:
-                                    status_callback("❌ File processing failed")
-                                    completion_callback()
+                        local_file_path = entry["FilePath"]
+                        if os.path.exists(local_file_path):
+                            transcription = self.audio_processor.process_file(
+                                local_file_path, status_callback,
+                                lambda segments: self.webhook_service.send_partial(notion_url, description, segments)
+                            )
+                            if transcription:
+                                drive_url = entry.get("URL", "")
+                                self.webhook_service.send_data(
+                                    notion_url, description, transcription, 
+                                    drive_url, local_file_path,
+                                    after_partials=True
+                                )
+                                callback(transcription, drive_url, local_file_path)
+                                completion_callback()
                             else:
-                                status_callback(f"❌ File not found: {local_file_path}")
+                                status_callback("❌ File processing failed")
                                 completion_callback()
-                            return
+                        else:
+                            status_callback(f"❌ File not found: {local_file_path}")
+                            completion_callback()
+                        return
 
         except Exception as e:
-            logging.error(f"[Monitor] Error reading history: {e}")
-            status_callback(f"⚠️ Error reading history: {str(e)}")
+            # A broken history fails the same way on every poll; log it once, the countdown keeps showing it
+            error_text = f"⚠️ Error reading history: {str(e)}"
+            if error_text != self.last_error_text:
+                self.last_error_text = error_text
+                logging.error(f"[Monitor] Error reading history: {e}")
+                status_callback(error_text)
+    
+    def _read_new_history_entries(self, history_path: str) -> List[Dict[str, Any]]:
+        """Parse only the history entries appended since the last read."""
+        stat = os.stat(history_path)
+        if stat.st_size == self._history_size and stat.st_mtime == self._history_mtime:
+            return []
+        
+        if stat.st_size < self._history_offset:
+            # History was truncated or replaced; start from the top again
+            logging.debug("[Monitor] History file shrank, re-reading from start")
+            self._history_offset = 0
+        
+        with open(history_path, 'rb') as f:
+            f.seek(self._history_offset)
+            chunk = f.read()
+        
+        # surrogateescape keeps a half-written UTF-8 sequence byte-exact for the offset math
+        text = chunk.decode('utf-8', errors='surrogateescape')
+        entries, consumed = parse_history_entries(text)
+        self._history_offset += len(text[:consumed].encode('utf-8', errors='surrogateescape'))
+        self._history_size = stat.st_size
+        self._history_mtime = stat.st_mtime
+        
+        if entries and logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"[Monitor] Parsed {len(entries)} new history entries")
+        return entries
     
     def stop_monitoring(self):
         """Stop the monitoring process."""
         self.monitoring_active = False
+        self._history_changed.set()
         logging.debug("[Monitor] Monitoring stopped by user")
\ No newline at end of file
@@ -5,10 +5,13 @@ import subprocess
 import platform
 import time
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import json
 from datetime import datetime, timezone, timedelta
 
+from core.constants import VALID_AUDIO_VIDEO_EXTENSIONS
+from utils.helpers import parse_iso_datetime
+
 try:
     from pynput.keyboard import Key, Controller
     keyboard_controller = Controller()
@@ -18,6 +21,48 @@ except ImportError:
     print("Warning: pynput not installed. ShareX keyboard shortcuts will not work.")
     print("Install with: pip install pynput")
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_HISTORY_DECODER = json.JSONDecoder()
+_HISTORY_SEPARATORS = " \t\r\n,\ufeff"
+
+def parse_history_entries(text: str) -> Tuple[List[Dict[str, Any]], int]:
+    """Decode consecutive ShareX history entries from text.
+    
+    Returns the parsed entries and the number of characters consumed. An
+    entry that ShareX is still writing is left unconsumed for the next read.
+    """
+    # Fast path: a fully written chunk parses in one call
+    body = text.strip(_HISTORY_SEPARATORS)
+    if not body:
+        return [], len(text)
+    try:
+        parsed = _json_loads("[" + body + "]")
+        return [entry for entry in parsed if isinstance(entry, dict)], len(text)
+    except ValueError:
+        pass
+    
+    entries = []
+    pos = 0
+    length = len(text)
+    while True:
+        while pos < length and text[pos] in _HISTORY_SEPARATORS:
+            pos += 1
+        if pos >= length:
+            break
+        try:
+            entry, pos_after = _HISTORY_DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            break
+        if isinstance(entry, dict):
+            entries.append(entry)
+        pos = pos_after
+    return entries, pos
+
 class ShareXService:
     def __init__(self, config_manager):
         self.config = config_manager
@@ -104,42 +149,45 @@ class ShareXService:
     def get_recent_files(self, hours_back: int = 24) -> List[Dict[str, Any]]:
         """Get recent audio/video files from ShareX history."""
         history_path = self.config.get("history_path")
-        if not history_path or not os.path.exists(history_path):
+        if not history_path:
             return []
         
         try:
-            with open(history_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            try:
+                with open(history_path, 'rb') as f:
+                    content = f.read().decode('utf-8', errors='replace')
+            except FileNotFoundError:
+                return []
 
-            raw_entries = "[" + content.replace("}\n{", "},\n{") + "]"
-            history = json.loads(raw_entries)
+            history, _ = parse_history_entries(content)
             
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
             audio_video_files = []
             
-            from core.constants import VALID_AUDIO_VIDEO_EXTENSIONS
-            
             for entry in reversed(history):
                 if "FilePath" in entry and "DateTime" in entry and "FileName" in entry:
                     try:
-                        entry_time = datetime.fromisoformat(entry["DateTime"].replace("Z", "+00:00"))
-                        if entry_time.tzinfo is None:
-                            entry_time = entry_time.replace(tzinfo=timezone.utc)
+                        entry_time = parse_iso_datetime(entry["DateTime"])
+                        
+                        # History is chronological; everything further back is older
+                        if entry_time <= cutoff_time:
+                            break
                         
-                        if entry_time > cutoff_time:
-                            file_name = entry.get("FileName", "").lower()
-                            if any(file_name.endswith(ext) for ext in VALID_AUDIO_VIDEO_EXTENSIONS):
-                                local_time = entry_time.astimezone()
-                                time_str = local_time.strftime("%Y-%m-%d %I:%M:%S %p")
-                                
-                                audio_video_files.append({
-                                    'filename': entry.get("FileName", "Unknown"),
-                                    'filepath': entry.get("FilePath", ""),
-                                    'url': entry.get("URL", ""),
-                                    'datetime': entry_time,
-                                    'display_time': time_str,
-                                    'display_text': f"{time_str} - {entry.get('FileName', 'Unknown')}"
-                                })
+                        file_name = entry.get("FileName", "").lower()
+                        if file_name.endswith(VALID_AUDIO_VIDEO_EXTENSIONS):
+                            local_time = entry_time.astimezone()
+                            time_str = local_time.strftime("%Y-%m-%d %I:%M:%S %p")
+                            
+                            audio_video_files.append({
+                                'filename': entry.get("FileName", "Unknown"),
+                                'filepath': entry.get("FilePath", ""),
+                                'url': entry.get("URL", ""),
+                                'datetime': entry_time,
+                                'display_time': time_str,
+                                'display_text': f"{time_str} - {entry.get('FileName', 'Unknown')}"
+                            })
+                            if len(audio_video_files) >= 20:
+                                break
                     except Exception as e:
                         logging.warning(f"[History] Error parsing entry: {e}")
                         continue
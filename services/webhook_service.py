@@ -1,24 +1,77 @@
 """Webhook communication service."""
 
 import os
+import json
+import queue
 import logging
+import threading
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, List, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 class WebhookService:
+    # (connect, read) timeouts in seconds. The final transcript waits as long as
+    # the n8n workflow takes, as before pooling: giving up early would report a
+    # delivered transcript as failed, and it must not be re-POSTed
+    TIMEOUT = (5, None)
+    # Partial segments are best-effort, so a stuck post mustn't hold up the queue
+    PARTIAL_TIMEOUT = (5, 30)
+    # Partial batches waiting to be posted before new ones are dropped
+    PARTIAL_QUEUE_SIZE = 100
+    # Longest a final transcript waits for its job's partial batches to go out
+    PARTIAL_FLUSH_TIMEOUT = 60
+    
     def __init__(self):
         self.webhook_url = os.getenv("WEBHOOK_URL", "").strip()
+        # Optional endpoint that receives transcript segments while transcription runs
+        self.partial_url = os.getenv("WEBHOOK_PARTIAL_URL", "").strip()
+        self.session = self._create_session()
+        self._partial_queue = queue.Queue(maxsize=self.PARTIAL_QUEUE_SIZE)
+        self._partial_worker = None
+        self._partial_worker_lock = threading.Lock()
+    
+    def _create_session(self) -> requests.Session:
+        """Create a pooled session that keeps the webhook connection alive."""
+        retry = Retry(
+            total=3,
+            # Connection failures are retried for any method. Read errors never are,
+            # and the default allowed_methods leaves POST out of status retries, since
+            # a 502/504 from a proxy can arrive after n8n already ran the workflow
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504]
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
     
     def send_data(self, notion_url: str, description: str, 
                   transcription: Optional[str] = None,
                   drive_url: Optional[str] = None,
                   local_file_path: Optional[str] = None,
                   result: Optional[str] = None,
-                  reason: Optional[str] = None) -> bool:
-        """Send data to webhook."""
+                  reason: Optional[str] = None,
+                  after_partials: bool = False) -> bool:
+        """Send data to webhook, blocking the calling thread until it answers.
+        
+        Unlike send_partial this is not queued, so the caller gets the result;
+        call it from a worker thread, never the GUI thread. With after_partials,
+        first wait (bounded) for the partial batches queued so far to be posted.
+        """
         if not self.webhook_url:
             logging.warning("[Webhook] No webhook URL configured in .env file.")
             return False
@@ -40,11 +93,94 @@ class WebhookService:
         if reason is not None:
             data["reason"] = reason
         
+        if after_partials:
+            # Let this job's queued partial segments land before the final transcript
+            self._wait_for_queued_partials()
+        
         try:
-            res = requests.post(self.webhook_url, json=data)
-            res.raise_for_status()
+            self._post_json(self.webhook_url, data)
             logging.debug("[Webhook] Sent successfully.")
             return True
         except Exception as e:
             logging.error(f"[Webhook] Failed to send: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    def send_partial(self, notion_url: str, description: str,
+                     segments: List[Tuple[float, float, str]]) -> bool:
+        """Queue a batch of transcript segments for the partial-results webhook.
+        
+        Posting happens on a background worker so transcription never waits
+        on the network. Returns False if no endpoint is set or the queue is full.
+        """
+        if not self.partial_url:
+            return False
+        
+        data = {
+            "notion_url": notion_url,
+            "description": description,
+            "segments": [
+                {"start": start, "end": end, "text": text}
+                for start, end, text in segments
+            ],
+        }
+        
+        self._ensure_partial_worker()
+        try:
+            self._partial_queue.put_nowait(data)
+            return True
+        except queue.Full:
+            logging.warning(f"[Webhook] Partial queue full, dropped {len(segments)} segments.")
+            return False
+    
+    def _wait_for_queued_partials(self) -> None:
+        """Wait until the partial batches queued so far are posted.
+        
+        A marker is queued behind them, so batches queued later by another
+        transcription don't extend the wait.
+        """
+        if self._partial_worker is None:
+            return
+        
+        posted = threading.Event()
+        try:
+            self._partial_queue.put(posted, timeout=self.PARTIAL_FLUSH_TIMEOUT)
+        except queue.Full:
+            logging.warning("[Webhook] Partial queue still full, sending transcript anyway.")
+            return
+        if not posted.wait(self.PARTIAL_FLUSH_TIMEOUT):
+            logging.warning("[Webhook] Partial segments still pending, sending transcript anyway.")
+    
+    def _ensure_partial_worker(self) -> None:
+        """Start the partial-results worker on first use."""
+        with self._partial_worker_lock:
+            if self._partial_worker is None:
+                self._partial_worker = threading.Thread(target=self._partial_worker_loop, daemon=True)
+                self._partial_worker.start()
+    
+    def _partial_worker_loop(self) -> None:
+        """Post queued partial batches in order."""
+        while True:
+            data = self._partial_queue.get()
+            if isinstance(data, threading.Event):
+                # Marker from _wait_for_queued_partials: everything before it is posted
+                data.set()
+                self._partial_queue.task_done()
+                continue
+            try:
+                self._post_json(self.partial_url, data, self.PARTIAL_TIMEOUT)
+                logging.debug(f"[Webhook] Sent {len(data['segments'])} partial segments.")
+            except Exception as e:
+                logging.warning(f"[Webhook] Failed to send partial segments: {e}")
+            finally:
+                self._partial_queue.task_done()
+    
+    def _post_json(self, url: str, data: dict, timeout: Optional[tuple] = None) -> None:
+        """POST data as JSON, raising on HTTP errors."""
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(data)
+        else:
+            payload = json.dumps(data).encode("utf-8")
+        
+        res = self.session.post(url, data=payload, headers=JSON_HEADERS,
+                                timeout=timeout or self.TIMEOUT)
+        res.raise_for_status()
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Utility functions module."""
 
-from .helpers import extract_notion_url
+from .helpers import extract_notion_url, format_countdown, parse_iso_datetime
 
 __all__ = [
-    'extract_notion_url'
+    'extract_notion_url',
+    'format_countdown',
+    'parse_iso_datetime'
 ]
\ No newline at end of file
@@ -1,7 +1,25 @@
 """Helper utility functions."""
 
 import re
+import html
+import sys
 import logging
+import functools
+from datetime import datetime, timezone
+
+try:
+    from ciso8601 import parse_datetime as _ciso_parse_datetime
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+# Compiled once; extract_notion_url runs for every calendar event shown
+# Anchor tags are replaced by their href so link text can't run into the URL
+HTML_ANCHOR_RE = re.compile(r'<a\b[^>]*?\bhref="([^"]*)"[^>]*>|</a\s*>', re.IGNORECASE)
+NOTION_URL_RE = re.compile(r'https://(?:www\.)?notion\.so/[^\s<>"]+')
+NOTION_P_PARAM_RE = re.compile(r'[?&]p=([a-f0-9]{32})', re.IGNORECASE)
+NOTION_PATH_ID_RE = re.compile(r'/[^/]+/([a-f0-9]{32})', re.IGNORECASE)
+HEX32_RE = re.compile(r'[a-f0-9]{32}', re.IGNORECASE)
 
 def extract_notion_url(description_text):
     """Extract Notion page ID from p= parameter or URL structure."""
@@ -9,29 +27,21 @@ def extract_notion_url(description_text):
         return ""
     
     # Remove HTML tags and decode entities
-    clean_text = description_text.replace('<a href="', '').replace('">', '').replace('</a>', '')
-    clean_text = clean_text.replace('&amp;', '&')
+    clean_text = html.unescape(HTML_ANCHOR_RE.sub(r'\1 ', description_text))
     
     logging.debug(f"[URL Extract] Processing description: {clean_text[:150]}...")
     
     # Find Notion URLs first
-    notion_url_patterns = [
-        r'https://www\.notion\.so/[^\s<>"]+',
-        r'https://notion\.so/[^\s<>"]+',
-    ]
-    
     notion_url = None
-    for pattern in notion_url_patterns:
-        matches = re.findall(pattern, clean_text)
-        if matches:
-            # Get the last/longest match
-            notion_url = matches[-1]
-            logging.debug(f"[URL Extract] Found Notion URL: {notion_url}")
-            break
+    matches = NOTION_URL_RE.findall(clean_text)
+    if matches:
+        # Get the last/longest match
+        notion_url = matches[-1]
+        logging.debug(f"[URL Extract] Found Notion URL: {notion_url}")
     
     if notion_url:
         # First priority: Look for p= parameter (this contains the actual page ID)
-        p_param_match = re.search(r'[?&]p=([a-f0-9]{32})', notion_url, re.IGNORECASE)
+        p_param_match = NOTION_P_PARAM_RE.search(notion_url)
         if p_param_match:
             page_id = p_param_match.group(1)
             clean_url = f"https://www.notion.so/{page_id}"
@@ -40,7 +50,7 @@ def extract_notion_url(description_text):
             return clean_url
         
         # Second priority: Look for page ID directly in path (like /rooche/32chars)
-        path_match = re.search(r'/[^/]+/([a-f0-9]{32})', notion_url, re.IGNORECASE)
+        path_match = NOTION_PATH_ID_RE.search(notion_url)
         if path_match:
             page_id = path_match.group(1)
             clean_url = f"https://www.notion.so/{page_id}"
@@ -49,7 +59,7 @@ def extract_notion_url(description_text):
             return clean_url
         
         # Third priority: Any 32-char hex string in the URL (use the first one found)
-        hex_matches = re.findall(r'[a-f0-9]{32}', notion_url, re.IGNORECASE)
+        hex_matches = HEX32_RE.findall(notion_url)
         if hex_matches:
             # Use the first one found (usually the main page ID)
             page_id = hex_matches[0]
@@ -59,8 +69,7 @@ def extract_notion_url(description_text):
             return clean_url
     
     # Final fallback: look for any 32-character hex string in the entire text
-    hex_pattern = r'[a-f0-9]{32}'
-    hex_matches = re.findall(hex_pattern, clean_text, re.IGNORECASE)
+    hex_matches = HEX32_RE.findall(clean_text)
     
     if hex_matches:
         # Use the first one found
@@ -70,4 +79,32 @@ def extract_notion_url(description_text):
         return clean_url
     
     logging.warning(f"[URL Extract] No valid Notion page ID found in: {clean_text}")
-    return clean_text.strip()
\ No newline at end of file
+    return clean_text.strip()
+
+def format_countdown(remaining_seconds):
+    """Format remaining seconds as HH:MM:SS, or MM:SS when under an hour."""
+    hours, remainder = divmod(int(remaining_seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    
+    if hours > 0:
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+@functools.lru_cache(maxsize=4096)
+def parse_iso_datetime(value):
+    """Parse an ISO 8601 timestamp as an aware datetime (naive means UTC), memoized per string."""
+    parsed = None
+    if CISO8601_AVAILABLE:
+        try:
+            parsed = _ciso_parse_datetime(value)
+        except ValueError:
+            # Let fromisoformat have a go at anything ciso8601 rejects
+            pass
+    if parsed is None:
+        if sys.version_info < (3, 11) and value.endswith("Z"):
+            # fromisoformat only accepts a trailing Z from Python 3.11
+            value = value[:-1] + "+00:00"
+        parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed